@@ -307,6 +307,12 @@ class AiAssistAgent:
         self.sessions: dict[str, ClientSession] = {}
         self.available_tools: list[dict] = []
         self.available_prompts: dict[str, dict] = {}  # {server_name: {prompt_name: Prompt}}
+        # Immutable copy of available_prompts for the completer, replaced wholesale by
+        # _refresh_prompts_snapshot(): ((server_name, lowercase names, names, descriptions), ...)
+        # with each server's prompts sorted case-insensitively
+        self._prompts_snapshot: tuple[tuple[str, tuple[str, ...], tuple[str, ...], tuple[str, ...]], ...] = ()
+        # Views rendered from the prompts (e.g. the /prompts table), reset with each new snapshot
+        self.prompts_views: dict[str, Any] = {}
         self.available_resources: dict[str, list] = {}  # {server_name: [Resource, ...]}
         self.available_resource_templates: dict[str, list] = {}  # {server_name: [ResourceTemplate, ...]}
         self._server_tasks: list[asyncio.Task] = []
@@ -568,6 +574,7 @@ class AiAssistAgent:
                         prompts_result = await session.list_prompts()
                         if prompts_result.prompts:
                             self.available_prompts[name] = {prompt.name: prompt for prompt in prompts_result.prompts}
+                            self._refresh_prompts_snapshot()
                             # Validate prompt descriptions for poisoning
                             for prompt in prompts_result.prompts:
                                 if prompt.description:
@@ -625,6 +632,28 @@ class AiAssistAgent:
 
             traceback.print_exc()
 
+    @property
+    def prompts_snapshot(self) -> tuple[tuple[str, tuple[str, ...], tuple[str, ...], tuple[str, ...]], ...]:
+        """Immutable view of the available prompts for completion (see _refresh_prompts_snapshot)"""
+        return self._prompts_snapshot
+
+    def _refresh_prompts_snapshot(self):
+        """Publish a new immutable prompts snapshot after available_prompts changed"""
+        snapshot = []
+        for server_name, prompts in self.available_prompts.items():
+            ordered = sorted(prompts.items(), key=lambda item: item[0].lower())
+            snapshot.append(
+                (
+                    server_name,
+                    tuple(prompt_name.lower() for prompt_name, _ in ordered),
+                    tuple(prompt_name for prompt_name, _ in ordered),
+                    tuple(prompt.description or "" for _, prompt in ordered),
+                )
+            )
+        # A single reference swap, so readers see either the old or the new snapshot
+        self._prompts_snapshot = tuple(snapshot)
+        self.prompts_views = {}
+
     def _disconnect_server(self, name: str):
         """Disconnect a single MCP server, cleaning up session, tools, prompts, resources, and task"""
         if name in self.sessions:
@@ -632,6 +661,7 @@ class AiAssistAgent:
         self.available_tools = [t for t in self.available_tools if t.get("_server") != name]
         if name in self.available_prompts:
             self.available_prompts.pop(name)
+            self._refresh_prompts_snapshot()
         if name in self.available_resources:
             self.available_resources.pop(name)
         if name in self.available_resource_templates:
@@ -1,43 +1,47 @@
 """Command validation utilities for ai-assist"""
 
-# Valid commands in interactive mode
-INTERACTIVE_COMMANDS = [
-    "/exit",
-    "/quit",
-    "/status",
-    "/history",
-    "/clear-cache",
-    "/help",
-    "/clear",
-    "/kg-save",
-    "/kg-viz",
-    "/awl-viz",
-    "/eval-stats",
-]
+# Valid commands in interactive mode (a set: validation only needs membership)
+INTERACTIVE_COMMANDS = frozenset(
+    {
+        "/exit",
+        "/quit",
+        "/status",
+        "/history",
+        "/clear-cache",
+        "/help",
+        "/clear",
+        "/kg-save",
+        "/kg-viz",
+        "/awl-viz",
+        "/eval-stats",
+    }
+)
 
 # Valid commands at CLI level
-CLI_COMMANDS = [
-    "/monitor",
-    "/query",
-    "/interactive",
-    "/run",
-    "/status",
-    "/clear-cache",
-    "/identity-show",
-    "/identity-init",
-    "/kg-stats",
-    "/kg-asof",
-    "/kg-late",
-    "/kg-changes",
-    "/kg-show",
-    "/cleanup-actions",
-    "/kg-viz",
-    "/awl-viz",
-    "/eval-stats",
-    "/sandbox",
-    "/service",
-    "/help",
-]
+CLI_COMMANDS = frozenset(
+    {
+        "/monitor",
+        "/query",
+        "/interactive",
+        "/run",
+        "/status",
+        "/clear-cache",
+        "/identity-show",
+        "/identity-init",
+        "/kg-stats",
+        "/kg-asof",
+        "/kg-late",
+        "/kg-changes",
+        "/kg-show",
+        "/cleanup-actions",
+        "/kg-viz",
+        "/awl-viz",
+        "/eval-stats",
+        "/sandbox",
+        "/service",
+        "/help",
+    }
+)
 
 
 def is_valid_interactive_command(user_input: str) -> bool:
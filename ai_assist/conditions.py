@@ -1,7 +1,10 @@
 """Condition evaluation and action execution for user-defined tasks"""
 
+import functools
 import logging
+import operator
 import re
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
@@ -11,6 +14,69 @@ from .state import StateManager
 
 logger = logging.getLogger(__name__)
 
+# Checked in this order, so two-character operators win over their one-character prefixes
+_COMPARISONS: tuple[tuple[str, Callable[[Any, Any], bool]], ...] = (
+    (">=", operator.ge),
+    ("<=", operator.le),
+    ("==", operator.eq),
+    ("!=", operator.ne),
+    (">", operator.gt),
+    ("<", operator.lt),
+)
+
+
+def _comparison(field: str, compare: Callable[[Any, Any], bool], value_str: str) -> Callable[[dict[str, Any]], bool]:
+    """Predicate comparing a metadata field against a literal value"""
+    # Numeric fields compare against the value as a float when it parses as one
+    number: float | None
+    try:
+        number = float(value_str)
+    except ValueError:
+        number = None
+
+    def check(metadata: dict[str, Any]) -> bool:
+        field_value: Any = metadata.get(field)
+        if field_value is None:
+            return False
+        if number is not None and isinstance(field_value, int | float):
+            return compare(field_value, number)
+        return compare(field_value, value_str)
+
+    return check
+
+
+@functools.lru_cache(maxsize=256)
+def compile_condition(condition_str: str) -> Callable[[dict[str, Any]], bool]:
+    """Parse a condition string once into a predicate over extracted metadata
+
+    See ConditionEvaluator.evaluate for the supported syntax. Task conditions
+    are fixed strings, so repeated runs reuse the cached predicate instead of
+    re-parsing the condition each time.
+    """
+    condition_str = condition_str.strip()
+
+    # Handle "contains" operator
+    if " contains " in condition_str:
+        field, value = condition_str.split(" contains ", 1)
+        field = field.strip()
+        value = value.strip().strip("'\"")
+        return lambda metadata: value in str(metadata.get(field, ""))
+
+    # Handle "not_contains" operator
+    if " not_contains " in condition_str:
+        field, value = condition_str.split(" not_contains ", 1)
+        field = field.strip()
+        value = value.strip().strip("'\"")
+        return lambda metadata: value not in str(metadata.get(field, ""))
+
+    # Handle comparison operators
+    for op, compare in _COMPARISONS:
+        if op in condition_str:
+            field, value_str = condition_str.split(op, 1)
+            return _comparison(field.strip(), compare, value_str.strip().strip("'\""))
+
+    return lambda metadata: False
+
 
 class ConditionEvaluator:
     """Evaluate conditions on task results"""
@@ -76,63 +142,7 @@ class ConditionEvaluator:
         - "status == 'failed'"
         - "message contains 'critical'"
         """
-        condition_str = condition_str.strip()
-
-        # Handle "contains" operator
-        if " contains " in condition_str:
-            parts = condition_str.split(" contains ", 1)
-            field = parts[0].strip()
-            value = parts[1].strip().strip("'\"")
-
-            str_field_value = str(metadata.get(field, ""))
-            return value in str_field_value
-
-        # Handle "not_contains" operator
-        if " not_contains " in condition_str:
-            parts = condition_str.split(" not_contains ", 1)
-            field = parts[0].strip()
-            value = parts[1].strip().strip("'\"")
-
-            str_field_value = str(metadata.get(field, ""))
-            return value not in str_field_value
-
-        # Handle comparison operators
-        for op in [">=", "<=", "==", "!=", ">", "<"]:
-            if op in condition_str:
-                parts = condition_str.split(op, 1)
-                field = parts[0].strip()
-                value_str = parts[1].strip().strip("'\"")
-
-                # Get field value from metadata
-                field_value: Any = metadata.get(field)
-                if field_value is None:
-                    return False
-
-                # Try to convert value to appropriate type
-                compare_value: Any
-                try:
-                    if isinstance(field_value, int | float):
-                        compare_value = float(value_str)
-                    else:
-                        compare_value = value_str
-                except ValueError, TypeError:
-                    compare_value = value_str
-
-                # Evaluate comparison
-                if op == ">":
-                    return field_value > compare_value
-                elif op == "<":
-                    return field_value < compare_value
-                elif op == ">=":
-                    return field_value >= compare_value
-                elif op == "<=":
-                    return field_value <= compare_value
-                elif op == "==":
-                    return field_value == compare_value
-                elif op == "!=":
-                    return field_value != compare_value
-
-        return False
+        return compile_condition(condition_str)(metadata)
 
 
 class ActionExecutor:
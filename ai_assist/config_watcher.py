@@ -38,7 +38,7 @@ class ConfigWatcher:
         # Watch mcp_servers.yaml
         mcp_file = config_dir / "mcp_servers.yaml"
         if mcp_file.exists():
-            watcher = FileWatchdog(mcp_file, self._on_mcp_change, debounce_seconds=1.0)
+            watcher = FileWatchdog(mcp_file, self._on_mcp_change, debounce_seconds=1.0, verify_content=True)
             await watcher.start()
             self.watchers.append(watcher)
             print(f"Watching {mcp_file} for changes")
@@ -46,7 +46,7 @@ class ConfigWatcher:
         # Watch identity.yaml
         identity_file = config_dir / "identity.yaml"
         if identity_file.exists():
-            watcher = FileWatchdog(identity_file, self._on_identity_change, debounce_seconds=1.0)
+            watcher = FileWatchdog(identity_file, self._on_identity_change, debounce_seconds=1.0, verify_content=True)
             await watcher.start()
             self.watchers.append(watcher)
             print(f"Watching {identity_file} for changes")
@@ -54,7 +54,7 @@ class ConfigWatcher:
         # Watch installed-skills.json
         skills_file = config_dir / "installed-skills.json"
         if skills_file.exists():
-            watcher = FileWatchdog(skills_file, self._on_skills_change, debounce_seconds=1.0)
+            watcher = FileWatchdog(skills_file, self._on_skills_change, debounce_seconds=1.0, verify_content=True)
             await watcher.start()
             self.watchers.append(watcher)
             print(f"Watching {skills_file} for changes")
@@ -77,7 +77,7 @@ class ConfigWatcher:
             skill_md = Path(skill.cache_path) / "SKILL.md"
             if skill_md.exists():
                 callback = self._make_skill_file_callback(skill.name)
-                watcher = FileWatchdog(skill_md, callback, debounce_seconds=1.0)
+                watcher = FileWatchdog(skill_md, callback, debounce_seconds=1.0, verify_content=True)
                 await watcher.start()
                 self._skill_watchers.append(watcher)
 
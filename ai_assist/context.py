@@ -56,12 +56,18 @@ class ConversationMemory:
                 {"role": "user", "content": "question 2"},
                 ...
             ]
+
+            The list and its dicts are freshly built on each call: callers
+            append to, pop from and truncate the messages in place.
         """
-        messages = []
-        for exchange in self.exchanges:
-            messages.append({"role": "user", "content": exchange["user"]})
-            messages.append({"role": "assistant", "content": exchange["assistant"]})
-        return messages
+        return [
+            message
+            for exchange in self.exchanges
+            for message in (
+                {"role": "user", "content": exchange["user"]},
+                {"role": "assistant", "content": exchange["assistant"]},
+            )
+        ]
 
     def load_exchanges(self, exchanges: list[dict[str, str]]):
         """Load exchanges from saved data, applying max_exchanges limit"""
@@ -3,49 +3,83 @@
 This module provides efficient file watching using OS-level events
 (inotify on Linux, FSEvents on macOS, ReadDirectoryChanges on Windows).
 
-A single Observer is shared per watched directory to avoid FSEvents
-errors on macOS where the same path cannot be scheduled twice.
+A single Observer is shared by every watched file in the process, and each
+directory is scheduled on it once. This keeps one dispatch thread for all
+watchers and avoids FSEvents errors on macOS where the same path cannot be
+scheduled twice.
 """
 
 import asyncio
+import hashlib
 import logging
+import time
 from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Any
 
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
+from watchdog.observers.api import ObservedWatch
 
 logger = logging.getLogger(__name__)
 
-# Shared observers per directory to avoid macOS FSEvents "already scheduled" errors
-_shared_observers: dict[str, tuple[Any, int]] = {}  # path -> (observer, refcount)
+# Process-wide Observer, created on first use and stopped when nothing is watched anymore
+_shared_observer: Any = None
+_shared_watches: dict[str, tuple[ObservedWatch, int]] = {}  # path -> (watch, refcount)
 
+# Network filesystems (NFS/CIFS) can report the same mtime for writes landing
+# within this window, so an unchanged stat is confirmed by content hash
+_MTIME_AMBIGUITY_SECONDS = 2.0
 
-def _get_shared_observer(watch_path: str) -> Any:
-    """Get or create a shared Observer for a directory."""
-    if watch_path in _shared_observers:
-        observer, refcount = _shared_observers[watch_path]
-        _shared_observers[watch_path] = (observer, refcount + 1)
-        return observer
 
-    observer = Observer()
-    _shared_observers[watch_path] = (observer, 1)
-    return observer
+def _schedule_shared(handler: FileSystemEventHandler, watch_path: str) -> None:
+    """Add a handler for a directory to the shared Observer, starting it on first use.
 
+    Raises:
+        OSError: If the directory cannot be watched (e.g. inotify limit reached)
+    """
+    global _shared_observer
+    if _shared_observer is None:
+        _shared_observer = Observer()
+    observer = _shared_observer
+
+    if watch_path in _shared_watches:
+        watch, refcount = _shared_watches[watch_path]
+        observer.add_handler_for_watch(handler, watch)
+        _shared_watches[watch_path] = (watch, refcount + 1)
+        return
 
-def _release_shared_observer(watch_path: str) -> None:
-    """Release a reference to a shared Observer, stopping it when no longer needed."""
-    if watch_path not in _shared_observers:
+    try:
+        watch = observer.schedule(handler, watch_path, recursive=False)
+        if not observer.is_alive():
+            observer.start()
+    except OSError:
+        if observer.is_alive():
+            observer.remove_handler_for_watch(handler, ObservedWatch(watch_path, recursive=False))
+        else:
+            _shared_observer = None
+        raise
+    _shared_watches[watch_path] = (watch, 1)
+
+
+def _unschedule_shared(handler: FileSystemEventHandler, watch_path: str) -> None:
+    """Remove a handler from the shared Observer, stopping it once no directory is watched."""
+    global _shared_observer
+    if _shared_observer is None or watch_path not in _shared_watches:
         return
 
-    observer, refcount = _shared_observers[watch_path]
+    watch, refcount = _shared_watches[watch_path]
     if refcount <= 1:
-        observer.stop()
-        observer.join(timeout=2.0)
-        del _shared_observers[watch_path]
+        _shared_observer.unschedule(watch)
+        del _shared_watches[watch_path]
     else:
-        _shared_observers[watch_path] = (observer, refcount - 1)
+        _shared_observer.remove_handler_for_watch(handler, watch)
+        _shared_watches[watch_path] = (watch, refcount - 1)
+
+    if not _shared_watches:
+        _shared_observer.stop()
+        _shared_observer.join(timeout=2.0)
+        _shared_observer = None
 
 
 class FileWatchdog:
@@ -55,13 +89,16 @@ class FileWatchdog:
     detection. Includes debouncing to avoid triggering callbacks for
     rapid successive changes.
 
-    Multiple FileWatchdog instances watching files in the same directory
-    share a single Observer to avoid macOS FSEvents errors.
+    All FileWatchdog instances share a single Observer; watchers of files in
+    the same directory also share its watch to avoid macOS FSEvents errors.
 
     Attributes:
         file_path: Path to the file to watch
         callback: Async function to call when file changes
         debounce_seconds: Wait time after last change before triggering callback
+        max_wait_seconds: Upper bound on how long a burst of changes can delay the callback
+        leading_edge: Whether the first change after a quiet period fires the callback immediately
+        verify_content: Whether an unchanged but recent stat is confirmed by hashing the file
     """
 
     def __init__(
@@ -69,6 +106,9 @@ class FileWatchdog:
         file_path: Path,
         callback: Callable[[], Awaitable[None]],
         debounce_seconds: float = 0.5,
+        max_wait_seconds: float | None = None,
+        leading_edge: bool = False,
+        verify_content: bool = False,
     ):
         """Initialize file watchdog.
 
@@ -77,10 +117,24 @@ class FileWatchdog:
             callback: Async function to call when file changes
             debounce_seconds: Wait time after last change before triggering.
                 Default 0.5s to avoid multiple triggers for atomic writes.
+            max_wait_seconds: If set, the callback fires at most this long after
+                the first change of a burst, even if changes keep arriving.
+                Default None waits for the burst to end.
+            leading_edge: If True, the first change after at least debounce_seconds
+                without a callback fires it right away; only the changes that
+                follow it within the window are debounced.
+            verify_content: If True, an event whose stat (mtime, size, inode) is
+                unchanged but whose mtime is recent hashes the file to catch
+                same-size rewrites on coarse-timestamp filesystems (NFS/CIFS).
+                Meant for small files rewritten in place; leave it off for
+                append-only logs, where a growing size always shows the change.
         """
         self.file_path = Path(file_path)
         self.callback = callback
         self.debounce_seconds = debounce_seconds
+        self.max_wait_seconds = max_wait_seconds
+        self.leading_edge = leading_edge
+        self.verify_content = verify_content
 
         self._watch_path: str | None = None
         self._handler: _DebounceHandler | None = None
@@ -102,25 +156,24 @@ class FileWatchdog:
             callback=self.callback,
             debounce_seconds=self.debounce_seconds,
             loop=loop,
+            max_wait_seconds=self.max_wait_seconds,
+            leading_edge=self.leading_edge,
+            verify_content=self.verify_content,
         )
 
-        # Get or create shared observer for this directory
+        # Register with the shared observer for this directory
         self._watch_path = str(self.file_path.parent)
-        observer = _get_shared_observer(self._watch_path)
-        observer.schedule(self._handler, self._watch_path, recursive=False)
-        if not observer.is_alive():
-            try:
-                observer.start()
-            except OSError:
-                logger.warning(
-                    "Failed to start file watcher for %s (inotify limit reached). "
-                    "File change detection disabled for this path.",
-                    self.file_path,
-                )
-                _release_shared_observer(self._watch_path)
-                self._watch_path = None
-                self._handler = None
-                self._running = False
+        try:
+            _schedule_shared(self._handler, self._watch_path)
+        except OSError:
+            logger.warning(
+                "Failed to start file watcher for %s (inotify limit reached). "
+                "File change detection disabled for this path.",
+                self.file_path,
+            )
+            self._watch_path = None
+            self._handler = None
+            self._running = False
 
     async def stop(self) -> None:
         """Stop watching the file."""
@@ -134,8 +187,8 @@ class FileWatchdog:
             await self._handler.cancel_pending()
 
         # Release shared observer
-        if self._watch_path:
-            _release_shared_observer(self._watch_path)
+        if self._watch_path and self._handler:
+            _unschedule_shared(self._handler, self._watch_path)
             self._watch_path = None
             self._handler = None
 
@@ -149,14 +202,65 @@ class _DebounceHandler(FileSystemEventHandler):
         callback: Callable[[], Awaitable[None]],
         debounce_seconds: float,
         loop: asyncio.AbstractEventLoop,
+        *,
+        max_wait_seconds: float | None = None,
+        leading_edge: bool = False,
+        verify_content: bool = False,
     ):
         super().__init__()
         self.target_file = target_file
         self.callback = callback
         self.debounce_seconds = debounce_seconds
+        self.max_wait_seconds = max_wait_seconds
+        self.leading_edge = leading_edge
+        self.verify_content = verify_content
         self.loop = loop
         self._debounce_task: asyncio.Task | None = None
-        self._last_mtime: float = target_file.stat().st_mtime if target_file.exists() else 0.0
+        # With leading_edge: the immediate callback task and the loop time of the last callback
+        self._leading_task: asyncio.Task | None = None
+        self._last_fire: float | None = None
+        # Loop time by which the current burst must be delivered (with max_wait_seconds)
+        self._burst_deadline: float | None = None
+        self._last_signature: tuple[int, int, int] | None = None
+        # Content hash taken the last time an unchanged stat had to be confirmed (verify_content)
+        self._last_digest: bytes | None = None
+        self._file_changed()
+
+    def _file_changed(self) -> bool:
+        """Check whether the target file changed since the last check.
+
+        Compares mtime, size and inode from a single stat() so editors that
+        save via rename are caught. A changed stat never reads the file. With
+        verify_content, an unchanged stat whose mtime is recent enough to be
+        ambiguous on coarse-grained filesystems is settled by a content hash;
+        the first such check has nothing to compare against and counts as a
+        change, so a rewrite is never missed.
+        """
+        try:
+            st = self.target_file.stat()
+        except OSError:
+            return False
+
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if signature != self._last_signature:
+            self._last_signature = signature
+            self._last_digest = None
+            return True
+
+        if not self.verify_content or time.time() - st.st_mtime >= _MTIME_AMBIGUITY_SECONDS:
+            return False
+
+        digest = self._content_digest()
+        if digest is not None and digest == self._last_digest:
+            return False
+        self._last_digest = digest
+        return True
+
+    def _content_digest(self) -> bytes | None:
+        try:
+            return hashlib.blake2b(self.target_file.read_bytes(), digest_size=16).digest()
+        except OSError:
+            return None
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file modification events."""
@@ -170,14 +274,9 @@ class _DebounceHandler(FileSystemEventHandler):
         if event_path != target_path:
             return
 
-        # macOS FSEvents emits directory-level events; guard with mtime to filter false positives.
-        try:
-            current_mtime = self.target_file.stat().st_mtime
-        except OSError:
-            return
-        if current_mtime == self._last_mtime:
+        # macOS FSEvents emits directory-level events; guard with a stat check to filter false positives.
+        if not self._file_changed():
             return
-        self._last_mtime = current_mtime
 
         print(f"Detected change in {self.target_file.name}", flush=True)
         # Trigger debounced callback
@@ -200,36 +299,64 @@ class _DebounceHandler(FileSystemEventHandler):
             target_path = self.target_file.resolve()
 
             if dest_path == target_path:
+                self._file_changed()  # Refresh the stored signature
                 print(f"Detected change in {self.target_file.name}", flush=True)
                 self._trigger_debounced()
 
     def _trigger_debounced(self) -> None:
         """Trigger callback after debounce period."""
-        # Cancel existing debounce task
-        if self._debounce_task and not self._debounce_task.done():
-            self._debounce_task.cancel()
-
         # Schedule new debounce task in the event loop
         # Use call_soon_threadsafe since observer runs in separate thread
         self.loop.call_soon_threadsafe(self._schedule_callback)
 
     def _schedule_callback(self) -> None:
         """Schedule callback in event loop (must be called from loop thread)."""
-        self._debounce_task = self.loop.create_task(self._debounced_callback())
+        now = self.loop.time()
+        pending = self._debounce_task is not None and not self._debounce_task.done()
+        leading_running = self._leading_task is not None and not self._leading_task.done()
+
+        # First change after a quiet period: deliver it now and debounce only what follows
+        if (
+            self.leading_edge
+            and not pending
+            and not leading_running
+            and (self._last_fire is None or now - self._last_fire >= self.debounce_seconds)
+        ):
+            self._last_fire = now
+            self._leading_task = self.loop.create_task(self._debounced_callback(0.0))
+            return
 
-    async def _debounced_callback(self) -> None:
+        # Cancel existing debounce task
+        if self._debounce_task and pending:
+            self._debounce_task.cancel()
+
+        delay = self.debounce_seconds
+        if self.max_wait_seconds is not None:
+            if self._burst_deadline is None:
+                self._burst_deadline = now + self.max_wait_seconds
+            delay = max(0.0, min(delay, self._burst_deadline - now))
+        self._debounce_task = self.loop.create_task(self._debounced_callback(delay))
+
+    async def _debounced_callback(self, delay: float) -> None:
         """Wait for debounce period then call callback."""
         try:
-            await asyncio.sleep(self.debounce_seconds)
+            await asyncio.sleep(delay)
+            # Never overlap a leading-edge callback that is still running
+            leading = self._leading_task
+            if leading is not None and leading is not asyncio.current_task() and not leading.done():
+                await asyncio.wait([leading])
+            self._burst_deadline = None
+            self._last_fire = self.loop.time()
             await self.callback()
         except asyncio.CancelledError:
             pass
 
     async def cancel_pending(self) -> None:
         """Cancel any pending debounce tasks."""
-        if self._debounce_task and not self._debounce_task.done():
-            self._debounce_task.cancel()
-            try:
-                await self._debounce_task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._leading_task, self._debounce_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
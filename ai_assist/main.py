@@ -236,6 +236,9 @@ async def basic_interactive_mode(agent: AiAssistAgent, state_manager: StateManag
     # Use the agent's renderer for inner execution visibility
     agent.on_inner_execution = agent.renderer.on_inner_execution
 
+    # Clock for exchange timestamps, looked up once for the whole session
+    loop = asyncio.get_running_loop()
+
     while True:
         try:
             user_input = input("You: ").strip()
@@ -383,9 +386,7 @@ async def basic_interactive_mode(agent: AiAssistAgent, state_manager: StateManag
                     total_chars = sum(len(str(m.get("content", ""))) for m in messages)
 
                 # Track conversation
-                conversation_context.append(
-                    {"user": user_input, "assistant": response, "timestamp": str(asyncio.get_event_loop().time())}
-                )
+                conversation_context.append({"user": user_input, "assistant": response, "timestamp": str(loop.time())})
 
         except KeyboardInterrupt, EOFError:
             print("\n\nGoodbye!")
@@ -81,7 +81,7 @@ class MonitoringScheduler:
 
         # Watch event-schedules.json for changes
         self.action_scheduler_file_watchdog = FileWatchdog(
-            self.action_scheduler.schedule_file, self.action_scheduler.reload, debounce_seconds=0.5
+            self.action_scheduler.schedule_file, self.action_scheduler.reload, debounce_seconds=0.5, verify_content=True
         )
         await self.action_scheduler_file_watchdog.start()
 
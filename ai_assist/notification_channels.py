@@ -1,12 +1,32 @@
 """Notification channel implementations"""
 
 import json
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ai_assist.notification_dispatcher import Notification
 
+# Panel icon and border color for each notification level
+LEVEL_ICONS: Mapping[str, str] = MappingProxyType(
+    {
+        "info": "ℹ️",
+        "success": "✅",
+        "warning": "⚠️",
+        "error": "❌",
+    }
+)
+LEVEL_COLORS: Mapping[str, str] = MappingProxyType(
+    {
+        "info": "cyan",
+        "success": "green",
+        "warning": "yellow",
+        "error": "red",
+    }
+)
+
 
 class ConsoleNotificationChannel:
     """Console-based notifications using Rich"""
@@ -17,23 +37,8 @@ class ConsoleNotificationChannel:
 
         console = Console()
 
-        # Icon based on level
-        icons = {
-            "info": "ℹ️",
-            "success": "✅",
-            "warning": "⚠️",
-            "error": "❌",
-        }
-        icon = icons.get(notification.level, "🔔")
-
-        # Color based on level
-        colors = {
-            "info": "cyan",
-            "success": "green",
-            "warning": "yellow",
-            "error": "red",
-        }
-        color = colors.get(notification.level, "white")
+        icon = LEVEL_ICONS.get(notification.level, "🔔")
+        color = LEVEL_COLORS.get(notification.level, "white")
 
         panel = Panel(
             f"{notification.message}\n\n[dim]{notification.timestamp.strftime('%Y-%m-%d %H:%M:%S')}[/dim]",
@@ -6,28 +6,48 @@ goes through an OutputRenderer. Two implementations:
 - RichRenderer: Rich console with Live/spinners for TUI
 """
 
+import functools
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
     from rich.console import Console
 
 
+@functools.lru_cache(maxsize=256)
 def _format_display_name(tool_name: str) -> str:
     """Format a tool name for user-friendly display."""
-    return tool_name.replace("mcp__", "").replace("__", " → ").replace("_", " ")
+    return tool_name.replace("mcp__", "", 1).replace("__", " → ").replace("_", " ")
 
 
-def _format_args_plain(input_dict: dict, max_len: int = 100) -> str:
-    """Format tool arguments for plain text display."""
+# Overall display budget for a tool's arguments; remaining arguments are elided past it
+_ARGS_DISPLAY_BUDGET = 400
+
+
+def _join_args(input_dict: dict, max_len: int, escape: Callable[[str], str] | None = None) -> str:
+    """Format tool arguments as key=value pairs, truncating each value and stopping once the budget is used."""
     parts = []
+    used = 0
     for key, value in input_dict.items():
+        if used >= _ARGS_DISPLAY_BUDGET:
+            parts.append("…")
+            break
         value_str = str(value).replace("\n", " ").replace("\r", "")
         if len(value_str) > max_len:
             value_str = value_str[:max_len] + "..."
-        parts.append(f"{key}={value_str}")
+        if escape:
+            value_str = escape(value_str)
+        piece = f"{key}={value_str}"
+        parts.append(piece)
+        used += len(piece) + 2
     return ", ".join(parts)
 
 
+def _format_args_plain(input_dict: dict, max_len: int = 100) -> str:
+    """Format tool arguments for plain text display."""
+    return _join_args(input_dict, max_len)
+
+
 class OutputRenderer(Protocol):
     """Protocol for rendering agent output to the user."""
 
@@ -127,21 +147,19 @@ def _format_args_rich(input_dict: dict, max_len: int = 100) -> str:
     """Format tool arguments for Rich display (with markup escaping)."""
     from rich.markup import escape
 
-    parts = []
-    for key, value in input_dict.items():
-        value_str = str(value).replace("\n", " ").replace("\r", "")
-        if len(value_str) > max_len:
-            value_str = value_str[:max_len] + "..."
-        parts.append(f"{key}={escape(value_str)}")
-    return ", ".join(parts)
+    return _join_args(input_dict, max_len, escape)
+
+
+# The Live widget only ever shows a spinner; a few frames per second are enough to animate it
+_SPINNER_REFRESH_PER_SECOND = 4
 
 
 class RichRenderer:
     """Rich console renderer with spinners and Markdown streaming.
 
     Uses a single Rich Live widget for the spinner only. Text is never put
-    into the Live widget — it is accumulated and printed via console.print
-    at flush time (show_text_done / stop).
+    into the Live widget — deltas are accumulated as a list of chunks and
+    printed with a single console.print at flush time (show_text_done / stop).
     """
 
     def __init__(self, console: Console, assistant_name: str = "Assistant"):
@@ -149,20 +167,15 @@ class RichRenderer:
         self._assistant_name = assistant_name
         self._live: Any = None
         self._live_running = False
-        self._pending_text = ""
+        self._spinner: Any = None
+        self._pending_chunks: list[str] = []
         self._response_started = False
 
     def start(self):
         """Start the initial spinner display."""
-        from rich.live import Live
-        from rich.spinner import Spinner
-
-        spinner = Spinner("dots", text="💭 Thinking...", style="cyan")
-        self._live = Live(spinner, console=self._console, refresh_per_second=10, transient=True)
-        self._live.start()
-        self._live_running = True
-        self._pending_text = ""
+        self._pending_chunks = []
         self._response_started = False
+        self._restart_spinner()
 
     def stop(self):
         """Stop and clean up the display."""
@@ -178,15 +191,16 @@ class RichRenderer:
 
     def _flush_text(self) -> None:
         """Print pending text via console.print and clear the buffer."""
-        if self._pending_text.strip():
+        text = "".join(self._pending_chunks)
+        self._pending_chunks = []
+        if text.strip():
             from rich.markdown import Markdown
 
-            self._console.print(Markdown(self._pending_text))
-        self._pending_text = ""
+            self._console.print(Markdown(text))
 
     def show_tool_call(self, tool_name: str, arguments: dict) -> None:
         self._stop_live()
-        self._pending_text = ""
+        self._pending_chunks = []
 
         display_name = _format_display_name(tool_name)
         self._console.print(f"\n[dim]🔧 {display_name}[/dim]")
@@ -202,7 +216,7 @@ class RichRenderer:
 
     def show_inner_tool_call(self, tool_name: str, arguments: dict) -> None:
         self._stop_live()
-        self._pending_text = ""
+        self._pending_chunks = []
 
         display_name = _format_display_name(tool_name)
         self._console.print(f"\n[dim]  🔧 {display_name}[/dim]")
@@ -226,7 +240,7 @@ class RichRenderer:
             self._console.print(f"[bold cyan]{self._assistant_name}:[/bold cyan]")
             self._response_started = True
 
-        self._pending_text += text
+        self._pending_chunks.append(text)
 
     def show_text_done(self) -> None:
         self._stop_live()
@@ -254,7 +268,13 @@ class RichRenderer:
         from rich.live import Live
         from rich.spinner import Spinner
 
-        spinner = Spinner("dots", text=text or "💭 Thinking...", style="cyan")
-        self._live = Live(spinner, console=self._console, refresh_per_second=10, transient=True)
+        # One spinner per renderer; only its text changes between tool calls
+        if self._spinner is None:
+            self._spinner = Spinner("dots", text=text or "💭 Thinking...", style="cyan")
+        else:
+            self._spinner.update(text=text or "💭 Thinking...")
+        self._live = Live(
+            self._spinner, console=self._console, refresh_per_second=_SPINNER_REFRESH_PER_SECOND, transient=True
+        )
         self._live.start()
         self._live_running = True
@@ -1,17 +1,31 @@
 """Shared utilities for prompt handling."""
 
+from typing import NamedTuple
+
+
+class PromptArgument(NamedTuple):
+    """Plain view of an MCP prompt argument"""
+
+    name: str
+    required: bool
+    description: str
+
+
+def prompt_arguments(prompt_def) -> tuple[PromptArgument, ...]:
+    """Normalize a prompt definition's arguments; a missing or empty list gives an empty tuple."""
+    return tuple(
+        PromptArgument(arg.name, bool(arg.required), arg.description or "")
+        for arg in getattr(prompt_def, "arguments", None) or ()
+    )
+
 
 def extract_prompt_messages(result, conversation_history: list) -> list[str]:
     """Convert prompt result messages to conversation history entries.
 
     Returns list of content strings for display purposes.
     """
-    contents = []
-    for msg in result.messages:
-        if hasattr(msg.content, "text"):
-            content = msg.content.text
-        else:
-            content = str(msg.content)
-        conversation_history.append({"role": msg.role, "content": content})
-        contents.append(content)
+    contents = [msg.content.text if hasattr(msg.content, "text") else str(msg.content) for msg in result.messages]
+    conversation_history.extend(
+        {"role": msg.role, "content": content} for msg, content in zip(result.messages, contents, strict=True)
+    )
     return contents
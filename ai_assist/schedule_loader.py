@@ -38,10 +38,10 @@ class ScheduleLoader:
                     trigger=monitor_data.get("trigger"),
                     description=monitor_data.get("description"),
                     enabled=monitor_data.get("enabled", True),
-                    conditions=monitor_data.get("conditions", []),
+                    conditions=tuple(monitor_data.get("conditions") or ()),
                     prompt_arguments=monitor_data.get("prompt_arguments"),
                     notify=monitor_data.get("notify", False),
-                    notification_channels=monitor_data.get("notification_channels", ["console"]),
+                    notification_channels=tuple(monitor_data.get("notification_channels") or ("console",)),
                 )
                 task.validate()
                 tasks.append(task)
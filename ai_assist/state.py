@@ -1,6 +1,7 @@
 """State management for persisting knowledge and monitoring history"""
 
 import json
+import os
 import time
 from datetime import datetime
 from pathlib import Path
@@ -147,18 +148,42 @@ class StateManager:
             return data.get("context")
 
     def get_history(self, monitor_name: str, limit: int = 10) -> list[dict]:
-        """Get historical results for a monitor"""
+        """Get historical results for a monitor
+
+        Only the tail of the history file is read, so the cost depends on
+        limit rather than on how long the history has grown.
+        """
         history_file = self.state_dir / "history" / f"{monitor_name}.jsonl"
 
         if not history_file.exists():
             return []
 
-        history = []
-        with open(history_file) as f:
-            for line in f:
-                history.append(json.loads(line))
+        if limit <= 0:
+            history = []
+            with open(history_file) as f:
+                for line in f:
+                    history.append(json.loads(line))
+            return history[-limit:]
+
+        return [json.loads(line) for line in self._tail_lines(history_file, limit)]
 
-        return history[-limit:]
+    @staticmethod
+    def _tail_lines(path: Path, count: int, chunk_size: int = 4096) -> list[bytes]:
+        """Return the last count non-empty lines of a file, reading backwards in chunks"""
+        with open(path, "rb") as f:
+            pos = f.seek(0, os.SEEK_END)
+            buffer = b""
+            while pos > 0 and buffer.count(b"\n") <= count:
+                read_size = min(chunk_size, pos)
+                pos -= read_size
+                f.seek(pos)
+                buffer = f.read(read_size) + buffer
+
+        lines = buffer.split(b"\n")
+        if pos > 0:
+            # First segment may start mid-line
+            lines = lines[1:]
+        return [line for line in lines if line.strip()][-count:]
 
     def append_history(self, monitor_name: str, result: dict):
         """Append result to monitor history"""
@@ -192,6 +217,9 @@ class StateManager:
 
     def cleanup_expired_cache(self):
         """Remove all expired cache entries (using monotonic time)"""
+        # Take both clocks once so the whole sweep uses the same cutoff
+        now_mono = time.monotonic()
+        now = datetime.now()
         removed = 0
         for cache_file in self.cache_dir.glob("*.json"):
             try:
@@ -202,11 +230,11 @@ class StateManager:
 
                 # Use monotonic time if available (new format)
                 if "cached_at_mono" in cache_data:
-                    age = time.monotonic() - cache_data["cached_at_mono"]
+                    age = now_mono - cache_data["cached_at_mono"]
                 else:
                     # Fallback to wall-clock time for old cache entries
                     cached_time = datetime.fromisoformat(cache_data["timestamp"])
-                    age = (datetime.now() - cached_time).total_seconds()
+                    age = (now - cached_time).total_seconds()
 
                 if age > ttl:
                     cache_file.unlink()
@@ -15,7 +15,7 @@ from .tasks import TaskDefinition
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskResult:
     """Result from executing a task"""
 
@@ -71,10 +71,11 @@ class TaskRunner:
             else:
                 output = await self.agent.query(prompt, max_turns=self.task_def.max_turns)
 
-            evaluator = ConditionEvaluator()
-            metadata = evaluator.extract_metadata(output)
-
+            # Metadata only feeds conditions; skip the regex scan of the output when there are none
+            metadata: dict[str, Any] = {}
             if self.task_def.conditions:
+                evaluator = ConditionEvaluator()
+                metadata = evaluator.extract_metadata(output)
                 executor = ActionExecutor(self.agent, self.state_manager)
 
                 for condition in self.task_def.conditions:
@@ -186,7 +187,7 @@ class TaskRunner:
             message=message,
             level=level,
             timestamp=result.timestamp,
-            channels=self.task_def.notification_channels,
+            channels=list(self.task_def.notification_channels),
             delivered={},
         )
 
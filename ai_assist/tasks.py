@@ -1,16 +1,120 @@
 """User-defined task definitions and YAML loader"""
 
+import functools
+import io
+import logging
 import re
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from datetime import time as dt_time
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import IO, Any
 
 import yaml
 
-
-@dataclass
+from .mcp_prompt import is_mcp_prompt, parse_mcp_prompt
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+# Day names (full and abbreviated) to weekday numbers
+_DAY_NAMES: Mapping[str, int] = MappingProxyType(
+    {
+        "monday": 0,
+        "mon": 0,
+        "tuesday": 1,
+        "tue": 1,
+        "wednesday": 2,
+        "wed": 2,
+        "thursday": 3,
+        "thu": 3,
+        "friday": 4,
+        "fri": 4,
+        "saturday": 5,
+        "sat": 5,
+        "sunday": 6,
+        "sun": 6,
+    }
+)
+
+# Read buffer for task files; the YAML reader pulls from it in large chunks
+_READ_BUFFER_SIZE = 1 << 20
+
+# Interval units in the order they may appear ("2h30m" but not "30m2h"), with their length in seconds
+_INTERVAL_UNITS = "hms"
+_INTERVAL_UNIT_SECONDS = (3600, 60, 1)
+
+
+def _scan_interval(interval_str: str) -> int | None:
+    """Sum a simple interval such as "30s", "5m", "1h" or "2h30m" in one pass
+
+    Each unit may appear once, in h/m/s order, optionally separated by
+    whitespace. Returns None if the string has any other shape.
+    """
+    total = 0
+    digits_start = -1
+    next_unit = 0
+    for i, char in enumerate(interval_str):
+        if char.isdecimal():
+            if digits_start < 0:
+                digits_start = i
+        elif digits_start >= 0:
+            unit = _INTERVAL_UNITS.find(char, next_unit)
+            if unit < 0:
+                return None
+            total += int(interval_str[digits_start:i]) * _INTERVAL_UNIT_SECONDS[unit]
+            digits_start = -1
+            next_unit = unit + 1
+        elif not char.isspace():
+            return None
+    if digits_start >= 0:
+        return None
+    return total
+
+
+# The looser syntax accepted before intervals had a grammar: the first "<n>h", "<n>m" and
+# "<n>s" found anywhere in the string, summed ("30m2h", "5min", "every 5m"). Saved actions
+# may still use it, so it is accepted with a warning.
+_LEGACY_INTERVAL_RES = tuple(re.compile(rf"(\d+){unit}") for unit in _INTERVAL_UNITS)
+
+
+def _scan_legacy_interval(interval_str: str) -> int:
+    """Sum an interval in the legacy loose syntax (0 if nothing matches)"""
+    total = 0
+    for pattern, unit_seconds in zip(_LEGACY_INTERVAL_RES, _INTERVAL_UNIT_SECONDS, strict=True):
+        match = pattern.search(interval_str)
+        if match:
+            total += int(match.group(1)) * unit_seconds
+    return total
+
+
+def _days_until_allowed(weekday: int, days: Iterable[int]) -> int:
+    """Number of days from weekday until the next weekday in days (0 if weekday is allowed)"""
+    return min((day - weekday) % 7 for day in days)
+
+
+class TaskValidationError(ExceptionGroup, ValueError):
+    """Several task definitions from one load failed validation"""
+
+    def __str__(self):
+        # Plain print()/logging of the group should still name every bad task and why
+        lines = [super().__str__()]
+        for exc in self.exceptions:
+            notes = getattr(exc, "__notes__", None)
+            lines.append(f"  - {exc} ({', '.join(notes)})" if notes else f"  - {exc}")
+        return "\n".join(lines)
+
+    def derive(self, excs):
+        return TaskValidationError(self.message, excs)
+
+
+@dataclass(slots=True)
 class TaskDefinition:
     """Definition of a user-defined periodic task or event-triggered task"""
 
@@ -20,13 +124,50 @@ class TaskDefinition:
     trigger: dict[str, Any] | None = None  # e.g., {"type": "mqtt", "topic": "alerts/#"}
     description: str | None = None
     enabled: bool = True
-    conditions: list[dict] = field(default_factory=list)
+    conditions: tuple[dict, ...] = ()
     prompt_arguments: dict[str, Any] | None = None
     max_turns: int = 100  # Maximum agentic turns (safety limit, loop detection usually triggers first)
 
     # Notification configuration
     notify: bool = False
-    notification_channels: list[str] = field(default_factory=lambda: ["console"])
+    # Immutable default shared by every task that doesn't override it
+    notification_channels: tuple[str, ...] = ("console",)
+
+    # Derived from interval once at construction: "event", "range", "time" or "interval"
+    _kind: str = field(init=False, default="", repr=False, compare=False)
+    _interval_seconds: int | None = field(init=False, default=None, repr=False, compare=False)
+    # (server, prompt) for a well-formed "mcp://server/prompt" reference, parsed once at construction
+    _mcp_prompt: tuple[str, str] | None = field(init=False, default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        # A missing or non-string prompt is left for validate() to report
+        if isinstance(self.prompt, str) and is_mcp_prompt(self.prompt):
+            try:
+                self._mcp_prompt = parse_mcp_prompt(self.prompt)
+            except ValueError:
+                # Left unset; validate() and parse_mcp_prompt re-parse to surface the error
+                pass
+
+        if self.interval is None:
+            self._kind = "event"
+            return
+        if not isinstance(self.interval, str):
+            # Left for validate() to report
+            self._kind = "interval"
+            return
+
+        lower = self.interval.lower()
+        if " between " in lower and " and " in lower:
+            self._kind = "range"
+        elif " on " in lower or lower.endswith(" daily") or lower.endswith(" everyday"):
+            self._kind = "time"
+        else:
+            self._kind = "interval"
+            try:
+                self._interval_seconds = TaskLoader.parse_interval(self.interval)
+            except ValueError:
+                # Left unset; validate() and interval_seconds re-parse to surface the error
+                pass
 
     @property
     def is_event_triggered(self) -> bool:
@@ -37,35 +178,27 @@ class TaskDefinition:
         """Convert interval string to seconds (for simple intervals)"""
         if self.interval is None:
             raise ValueError("Event-triggered tasks have no interval")
+        if self._interval_seconds is not None:
+            return self._interval_seconds
         return TaskLoader.parse_interval(self.interval)
 
     @property
     def is_interval_with_range(self) -> bool:
         """Check if this is an interval-with-range schedule (e.g. '1h between 9:00 and 23:00')"""
-        if self.interval is None:
-            return False
-        lower = self.interval.lower()
-        return " between " in lower and " and " in lower
+        return self._kind == "range"
 
     @property
     def is_time_based(self) -> bool:
         """Check if this is a time-based schedule"""
-        if self.interval is None:
-            return False
-        lower = self.interval.lower()
-        if self.is_interval_with_range:
-            return False
-        return " on " in lower or lower.endswith(" daily") or lower.endswith(" everyday")
+        return self._kind == "time"
 
     @property
     def is_mcp_prompt(self) -> bool:
-        from .mcp_prompt import is_mcp_prompt
-
-        return is_mcp_prompt(self.prompt)
+        return self._mcp_prompt is not None or is_mcp_prompt(self.prompt)
 
     def parse_mcp_prompt(self) -> tuple[str, str]:
-        from .mcp_prompt import parse_mcp_prompt
-
+        if self._mcp_prompt is not None:
+            return self._mcp_prompt
         return parse_mcp_prompt(self.prompt)
 
     @classmethod
@@ -78,10 +211,10 @@ class TaskDefinition:
             trigger=task_data.get("trigger"),
             description=task_data.get("description"),
             enabled=task_data.get("enabled", True),
-            conditions=task_data.get("conditions", []),
+            conditions=tuple(task_data.get("conditions") or ()),
             prompt_arguments=task_data.get("prompt_arguments"),
             notify=task_data.get("notify", False),
-            notification_channels=task_data.get("notification_channels", ["console"]),
+            notification_channels=tuple(task_data.get("notification_channels") or ("console",)),
         )
 
     def validate(self):
@@ -109,7 +242,8 @@ class TaskDefinition:
                 raise ValueError(f"Invalid MCP prompt reference: {e}") from e
 
         # Validate interval format (trigger tasks return early above, so interval is set here)
-        assert self.interval is not None
+        if not isinstance(self.interval, str):
+            raise ValueError(f"Invalid interval {self.interval!r}: must be a string such as '5m' or '9:00 daily'")
         try:
             if self.is_interval_with_range:
                 TaskLoader.parse_interval_with_range(self.interval)
@@ -125,20 +259,52 @@ class TaskLoader:
     """Load and parse task definitions from YAML"""
 
     # Time presets
-    TIME_PRESETS = {
-        "morning": "9:00",
-        "afternoon": "14:00",
-        "evening": "18:00",
-        "night": "22:00",
-    }
+    TIME_PRESETS: Mapping[str, str] = MappingProxyType(
+        {
+            "morning": "9:00",
+            "afternoon": "14:00",
+            "evening": "18:00",
+            "night": "22:00",
+        }
+    )
 
     # Day groups
-    DAY_GROUPS = {
-        "weekdays": [0, 1, 2, 3, 4],  # Monday-Friday
-        "weekends": [5, 6],  # Saturday-Sunday
-        "daily": [0, 1, 2, 3, 4, 5, 6],  # Every day
-        "everyday": [0, 1, 2, 3, 4, 5, 6],
-    }
+    DAY_GROUPS: Mapping[str, tuple[int, ...]] = MappingProxyType(
+        {
+            "weekdays": (0, 1, 2, 3, 4),  # Monday-Friday
+            "weekends": (5, 6),  # Saturday-Sunday
+            "daily": (0, 1, 2, 3, 4, 5, 6),  # Every day
+            "everyday": (0, 1, 2, 3, 4, 5, 6),
+        }
+    )
+
+    def _build_tasks(self, data: Any) -> list[TaskDefinition]:
+        """Build and validate tasks from parsed YAML"""
+        if not data or "tasks" not in data:
+            return []
+
+        tasks = []
+        errors: list[ValueError] = []
+        for task_data in data["tasks"]:
+            # Keep going after a bad task so every problem in the file is reported at once
+            try:
+                try:
+                    task = TaskDefinition.from_dict(task_data)
+                except KeyError as e:
+                    raise ValueError(f"Missing required field in task definition: {e}") from e
+                task.validate()
+            except ValueError as e:
+                e.add_note(f"in task '{task_data.get('name', 'unknown')}'")
+                errors.append(e)
+                continue
+            tasks.append(task)
+
+        if len(errors) == 1:
+            raise errors[0]
+        if errors:
+            raise TaskValidationError(f"{len(errors)} invalid task definitions", errors)
+
+        return tasks
 
     @staticmethod
     def parse_time_schedule(schedule_str: str) -> dict:
@@ -152,6 +318,13 @@ class TaskLoader:
         Returns:
             dict with 'time' (datetime.time) and 'days' (list of weekday numbers)
         """
+        schedule_time, days = TaskLoader._parse_time_schedule(schedule_str)
+        return {"time": schedule_time, "days": list(days)}
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_time_schedule(schedule_str: str) -> tuple[dt_time, tuple[int, ...]]:
+        """Memoized parse behind parse_time_schedule, returning immutable values"""
         schedule_str = schedule_str.strip().lower()
 
         if " on " in schedule_str:
@@ -186,42 +359,25 @@ class TaskLoader:
                 "Use HH:MM (24-hour) or presets: morning, afternoon, evening, night"
             ) from e
 
-        # Parse days
+        # Parse days (groups are already sorted and unique)
         if days_part in TaskLoader.DAY_GROUPS:
-            days = TaskLoader.DAY_GROUPS[days_part]
-        else:
-            # Parse individual days
-            day_names = {
-                "monday": 0,
-                "mon": 0,
-                "tuesday": 1,
-                "tue": 1,
-                "wednesday": 2,
-                "wed": 2,
-                "thursday": 3,
-                "thu": 3,
-                "friday": 4,
-                "fri": 4,
-                "saturday": 5,
-                "sat": 5,
-                "sunday": 6,
-                "sun": 6,
-            }
-
-            day_parts = [d.strip() for d in days_part.split(",")]
-            days = []
-            for day in day_parts:
-                if day in day_names:
-                    days.append(day_names[day])
-                else:
-                    raise ValueError(
-                        f"Invalid day: '{day}'. " "Use day names (monday, tuesday, etc.) or groups (weekdays, weekends)"
-                    )
-
-            if not days:
-                raise ValueError("At least one day must be specified")
-
-        return {"time": schedule_time, "days": sorted(set(days))}
+            return schedule_time, TaskLoader.DAY_GROUPS[days_part]
+
+        # Parse individual days
+        day_parts = [d.strip() for d in days_part.split(",")]
+        days = []
+        for day in day_parts:
+            if day in _DAY_NAMES:
+                days.append(_DAY_NAMES[day])
+            else:
+                raise ValueError(
+                    f"Invalid day: '{day}'. " "Use day names (monday, tuesday, etc.) or groups (weekdays, weekends)"
+                )
+
+        if not days:
+            raise ValueError("At least one day must be specified")
+
+        return schedule_time, tuple(sorted(set(days)))
 
     @staticmethod
     def calculate_next_run(schedule: dict, from_time: datetime | None = None) -> datetime:
@@ -237,27 +393,19 @@ class TaskLoader:
         if from_time is None:
             from_time = datetime.now()
 
-        schedule_time = schedule["time"]
-        allowed_days = set(schedule["days"])
+        days = schedule["days"]
+        if not days:
+            raise ValueError(f"Could not find next run time for schedule: {schedule}")
 
         # Start from the same day at the scheduled time
-        next_run = datetime.combine(from_time.date(), schedule_time)
+        next_run = datetime.combine(from_time.date(), schedule["time"])
 
         # If time has passed today, start from tomorrow
-        if next_run <= from_time:
-            next_run += timedelta(days=1)
-
-        # Find next allowed day
-        max_attempts = 7  # Don't loop forever
-        attempts = 0
-        while next_run.weekday() not in allowed_days and attempts < max_attempts:
-            next_run += timedelta(days=1)
-            attempts += 1
-
-        if attempts >= max_attempts:
-            raise ValueError(f"Could not find next run time for schedule: {schedule}")
+        day_offset = 1 if next_run <= from_time else 0
 
-        return next_run
+        # Jump straight to the next allowed day
+        day_offset += _days_until_allowed((from_time.weekday() + day_offset) % 7, days)
+        return next_run + timedelta(days=day_offset)
 
     @staticmethod
     def parse_interval_with_range(schedule_str: str) -> dict:
@@ -311,29 +459,13 @@ class TaskLoader:
         if days_str:
             days_str = days_str.strip()
             if days_str in TaskLoader.DAY_GROUPS:
-                days = TaskLoader.DAY_GROUPS[days_str]
+                days = list(TaskLoader.DAY_GROUPS[days_str])
             else:
-                day_names = {
-                    "monday": 0,
-                    "mon": 0,
-                    "tuesday": 1,
-                    "tue": 1,
-                    "wednesday": 2,
-                    "wed": 2,
-                    "thursday": 3,
-                    "thu": 3,
-                    "friday": 4,
-                    "fri": 4,
-                    "saturday": 5,
-                    "sat": 5,
-                    "sunday": 6,
-                    "sun": 6,
-                }
                 day_parts = [d.strip() for d in days_str.split(",")]
                 days = []
                 for day in day_parts:
-                    if day in day_names:
-                        days.append(day_names[day])
+                    if day in _DAY_NAMES:
+                        days.append(_DAY_NAMES[day])
                     else:
                         raise ValueError(f"Invalid day: '{day}'")
                 days = sorted(set(days))
@@ -359,54 +491,44 @@ class TaskLoader:
         if from_time is None:
             from_time = datetime.now()
 
+        # Work in seconds since midnight and only build a datetime for the result
         start = schedule["start"]
+        start_s = start.hour * 3600 + start.minute * 60 + start.second
         end = schedule["end"]
+        end_s = end.hour * 3600 + end.minute * 60 + end.second
         interval = schedule["interval_seconds"]
-        allowed_days = set(schedule["days"]) if schedule["days"] is not None else None
-
-        current_time = from_time.time()
-        today = from_time.date()
-
-        def _is_allowed_day(d: datetime) -> bool:
-            if allowed_days is None:
-                return True
-            return d.weekday() in allowed_days
-
-        def _next_allowed_day_at_start(base_date) -> datetime:
-            """Find next allowed day starting from base_date, at the start time."""
-            candidate = datetime.combine(base_date, start)
-            max_attempts = 7
-            for _ in range(max_attempts):
-                if _is_allowed_day(candidate):
-                    return candidate
-                candidate += timedelta(days=1)
-            raise ValueError(f"Could not find next allowed day for schedule: {schedule}")
-
-        # Check if we're within the active range today
-        if current_time < start:
-            # Before range: next run is today at start (if allowed day)
-            candidate = datetime.combine(today, start)
-            if _is_allowed_day(candidate):
-                return candidate
-            return _next_allowed_day_at_start(today + timedelta(days=1))
-
-        if current_time >= end:
-            # After range: next run is tomorrow at start (next allowed day)
-            return _next_allowed_day_at_start(today + timedelta(days=1))
-
-        # Within range: next run is from_time + interval
-        next_run = from_time + timedelta(seconds=interval)
-        if next_run.time() >= end:
-            # Would exceed range: next run is tomorrow at start
-            return _next_allowed_day_at_start(today + timedelta(days=1))
-
-        # Still within range and on an allowed day
-        if _is_allowed_day(next_run):
-            return next_run
-
-        return _next_allowed_day_at_start(today + timedelta(days=1))
+        days = schedule["days"]
+
+        cur_s = from_time.hour * 3600 + from_time.minute * 60 + from_time.second
+        weekday = from_time.weekday()
+        midnight = datetime(from_time.year, from_time.month, from_time.day)
+
+        def _next_allowed_day_at_start(day_offset: int) -> datetime:
+            """Start time on the first allowed day at least day_offset days from today."""
+            if days is not None:
+                if not days:
+                    raise ValueError(f"Could not find next allowed day for schedule: {schedule}")
+                day_offset += _days_until_allowed((weekday + day_offset) % 7, days)
+            return midnight + timedelta(days=day_offset, seconds=start_s)
+
+        # Before range: next run is today at start (or the next allowed day)
+        if cur_s < start_s:
+            return _next_allowed_day_at_start(0)
+
+        # After range: next run is tomorrow at start (next allowed day)
+        if cur_s >= end_s:
+            return _next_allowed_day_at_start(1)
+
+        # Within range: next run is from_time + interval, unless that leaves the range
+        # or lands on a day that isn't allowed
+        day_offset, next_s = divmod(cur_s + interval, 86400)
+        if next_s >= end_s or (days is not None and (weekday + day_offset) % 7 not in days):
+            return _next_allowed_day_at_start(1)
+
+        return from_time + timedelta(seconds=interval)
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def parse_interval(interval_str: str) -> int:
         """Convert interval string to seconds
 
@@ -420,24 +542,17 @@ class TaskLoader:
             raise ValueError("Interval cannot be empty")
 
         interval_str = interval_str.strip().lower()
-        total_seconds = 0
-
-        # Parse hours
-        hours_match = re.search(r"(\d+)h", interval_str)
-        if hours_match:
-            total_seconds += int(hours_match.group(1)) * 3600
-
-        # Parse minutes
-        minutes_match = re.search(r"(\d+)m", interval_str)
-        if minutes_match:
-            total_seconds += int(minutes_match.group(1)) * 60
-
-        # Parse seconds
-        seconds_match = re.search(r"(\d+)s", interval_str)
-        if seconds_match:
-            total_seconds += int(seconds_match.group(1))
-
-        if total_seconds == 0:
+        total_seconds = _scan_interval(interval_str)
+        if total_seconds is None:
+            total_seconds = _scan_legacy_interval(interval_str)
+            if total_seconds:
+                logger.warning(
+                    "Interval '%s' uses a deprecated format; use each of h, m and s at most once, "
+                    "in that order (e.g. '2h30m')",
+                    interval_str,
+                )
+
+        if not total_seconds:
             raise ValueError(
                 f"Invalid interval format: '{interval_str}'. " "Use formats like '30s', '5m', '1h', or '2h30m'"
             )
@@ -449,43 +564,26 @@ class TaskLoader:
         if not path.exists():
             return []
 
-        try:
-            with open(path) as f:
-                data = yaml.safe_load(f)
-
-            if not data or "tasks" not in data:
-                return []
-
-            tasks = []
-            for task_data in data["tasks"]:
-                task = TaskDefinition.from_dict(task_data)
-                task.validate()
-                tasks.append(task)
-
-            return tasks
+        return self._build_tasks(self._parse_yaml_file(path))
 
+    @staticmethod
+    def _parse_yaml(stream: IO[str] | IO[bytes]) -> Any:
+        """Parse a YAML stream without touching loader state"""
+        try:
+            return yaml.load(stream, Loader=_SafeLoader)  # nosec B506
         except yaml.YAMLError as e:
             raise ValueError(f"YAML parsing error: {e}") from e
-        except KeyError as e:
-            raise ValueError(f"Missing required field in task definition: {e}") from e
-
-    def load_from_yaml_string(self, yaml_content: str) -> list[TaskDefinition]:
-        """Load task definitions from YAML string (for testing)"""
-        try:
-            data = yaml.safe_load(yaml_content)
-
-            if not data or "tasks" not in data:
-                return []
 
-            tasks = []
-            for task_data in data["tasks"]:
-                task = TaskDefinition.from_dict(task_data)
-                task.validate()
-                tasks.append(task)
+    @staticmethod
+    def _parse_yaml_file(path: Path) -> Any:
+        """Read and parse a YAML file, letting the YAML reader decode the raw bytes"""
+        with open(path, "rb", buffering=_READ_BUFFER_SIZE) as f:
+            return TaskLoader._parse_yaml(f)
 
-            return tasks
+    def load_from_stream(self, stream: IO[str] | IO[bytes]) -> list[TaskDefinition]:
+        """Load task definitions from an open text or binary YAML stream"""
+        return self._build_tasks(self._parse_yaml(stream))
 
-        except yaml.YAMLError as e:
-            raise ValueError(f"YAML parsing error: {e}") from e
-        except KeyError as e:
-            raise ValueError(f"Missing required field in task definition: {e}") from e
+    def load_from_yaml_string(self, yaml_content: str) -> list[TaskDefinition]:
+        """Load task definitions from YAML string (for testing)"""
+        return self.load_from_stream(io.StringIO(yaml_content))
@@ -1,16 +1,22 @@
 """TUI components for ai-assist"""
 
+import bisect
+import functools
+import itertools
 import os
+from collections.abc import Sequence
+from typing import ClassVar
 
 from prompt_toolkit.completion import Completer, Completion
 
 
+@functools.lru_cache(maxsize=256)
 def format_tool_display_name(tool_name: str) -> str:
     """Format a tool name for user-friendly display.
 
     Converts internal tool names like 'mcp__dci__search' to 'dci → search'.
     """
-    return tool_name.replace("mcp__", "").replace("__", " → ").replace("_", " ")
+    return tool_name.replace("mcp__", "", 1).replace("__", " → ").replace("_", " ")
 
 
 def format_tool_args(input_dict: dict, max_len: int = 100) -> str:
@@ -30,9 +36,53 @@ def format_tool_args(input_dict: dict, max_len: int = 100) -> str:
     return ", ".join(args_display)
 
 
+def _last_word(text: str) -> str:
+    """Last whitespace-separated token of text ("" if none), without splitting the whole line"""
+    parts = text.rsplit(maxsplit=1)
+    return parts[-1] if parts else ""
+
+
+def _prefix_range(sorted_items: Sequence[str], prefix: str) -> tuple[int, int]:
+    """Return the index range of the items of a sorted sequence that start with prefix, using binary search."""
+    lo = bisect.bisect_left(sorted_items, prefix)
+    return lo, bisect.bisect_left(sorted_items, prefix + "\U0010ffff", lo)
+
+
+def _prefix_matches(sorted_items: Sequence[str], prefix: str) -> Sequence[str]:
+    """Return the items of a sorted sequence that start with prefix, using binary search."""
+    lo, hi = _prefix_range(sorted_items, prefix)
+    return sorted_items[lo:hi]
+
+
 class AiAssistCompleter(Completer):
     """Command completer for ai-assist interactive mode"""
 
+    COMMAND_DESCRIPTIONS: ClassVar[dict[str, str]] = {
+        "/status": "Show state statistics",
+        "/history": "Show recent monitoring history",
+        "/clear-cache": "Clear expired cache",
+        "/clear": "Clear conversation memory",
+        "/kg-save": "Toggle knowledge graph auto-save",
+        "/kg-viz": "Visualize knowledge graph in browser",
+        "/awl-viz": "Visualize an AWL workflow in browser",
+        "/prompts": "List available MCP prompts",
+        "/search": "Search conversation history",
+        "/skill/install": "Install an Agent Skill from git, local path, or ClawHub",
+        "/skill/uninstall": "Uninstall an installed Agent Skill",
+        "/skill/list": "List all installed Agent Skills",
+        "/skill/search": "Search ClawHub and skills.sh for skills",
+        "/skill/add_env": "Allow an env var for a skill's scripts",
+        "/skill/remove_env": "Remove an allowed env var from a skill",
+        "/skill/list_env": "Show allowed env vars for skills",
+        "/mcp/restart": "Restart an MCP server",
+        "/exit": "Exit interactive mode",
+        "/quit": "Exit interactive mode",
+        "/help": "Show help message",
+    }
+
+    # prompt_toolkit only shows a small window of candidates; stop generating past this
+    MAX_COMPLETIONS: ClassVar[int] = 50
+
     def __init__(self, agent=None):
         self.agent = agent
         self.commands = [
@@ -57,6 +107,50 @@ class AiAssistCompleter(Completer):
             "/quit",
             "/help",
         ]
+        # Sorted view for prefix lookups; matches are yielded in the order above
+        self._sorted_commands = sorted(self.commands)
+        self._command_order = {cmd: i for i, cmd in enumerate(self.commands)}
+
+    def _get_prompt_completions(self, token: str):
+        """Complete a /server or /server/prompt token from the agent's prompts snapshot"""
+        # Read the snapshot once; the agent replaces it rather than mutating it
+        snapshot = self.agent.prompts_snapshot
+        parts = token.lstrip("/").split("/")
+
+        # Completing MCP prompts: /server/prompt
+        if len(parts) == 2 and parts[0] != "skill":
+            server_name, prompt_prefix = parts
+            for server, names_lower, names, descriptions in snapshot:
+                if server == server_name:
+                    lo, hi = _prefix_range(names_lower, prompt_prefix.lower())
+                    for i in range(lo, hi):
+                        yield self._prompt_completion(token, server, names[i], descriptions[i])
+                    return
+
+        # Completing server names: /server, plus all their prompts for direct access
+        elif len(parts) == 1:
+            token_lower = token.lower()
+            for server, _, names, descriptions in snapshot:
+                server_cmd = f"/{server}/"
+                if server_cmd.startswith(token_lower):
+                    yield Completion(
+                        server_cmd,
+                        start_position=-len(token),
+                        display=server_cmd,
+                        display_meta=f"MCP server ({len(names)} prompts)",
+                    )
+                    for name, description in zip(names, descriptions, strict=True):
+                        yield self._prompt_completion(token, server, name, description)
+
+    @staticmethod
+    def _prompt_completion(token: str, server: str, name: str, description: str) -> Completion:
+        full_command = f"/{server}/{name}"
+        return Completion(
+            full_command,
+            start_position=-len(token),
+            display=full_command,
+            display_meta=description[:60] if description else "MCP prompt",
+        )
 
     @staticmethod
     def _is_path_prefix(word: str) -> bool:
@@ -75,10 +169,11 @@ class AiAssistCompleter(Completer):
             entries = os.listdir(search_dir)
         except OSError:
             return
+        prefix_lower = prefix.lower()
         for entry in sorted(entries):
             if not prefix and entry.startswith("."):
                 continue
-            if entry.lower().startswith(prefix.lower()):
+            if entry.lower().startswith(prefix_lower):
                 full_path = os.path.join(search_dir, entry)
                 is_dir = os.path.isdir(full_path)
                 suffix = "/" if is_dir else ""
@@ -88,26 +183,27 @@ class AiAssistCompleter(Completer):
                 )
 
     def get_completions(self, document, complete_event):
-        """Get completions for the current input"""
-        text = document.text_before_cursor
-
-        words = text.split()
-        if words:
-            last_word = words[-1]
-            if self._is_path_prefix(last_word):
-                yield from self._get_path_completions(last_word)
-                return
+        """Get completions for the current input, capped at MAX_COMPLETIONS"""
+        yield from itertools.islice(self._iter_completions(document.text_before_cursor), self.MAX_COMPLETIONS)
+
+    def _iter_completions(self, text: str):
+        """Generate all completions for the text before the cursor"""
+        last_word = _last_word(text)
+        if self._is_path_prefix(last_word):
+            yield from self._get_path_completions(last_word)
+            return
 
         # Only complete if line starts with /
         if text.startswith("/"):
             word = text  # Keep the full text including /
+            word_lower = word.lower()
 
             # Special handling for skill commands with arguments (space-separated)
             if text.startswith("/skill/uninstall ") and self.agent:
                 # Complete with installed skill names
-                prefix = text.split(" ", 1)[1] if " " in text else ""
+                prefix = text.split(" ", 1)[1].lower() if " " in text else ""
                 for skill in self.agent.skills_manager.installed_skills:
-                    if skill.name.startswith(prefix.lower()):
+                    if skill.name.startswith(prefix):
                         full_command = f"/skill/uninstall {skill.name}"
                         yield Completion(
                             full_command,
@@ -151,122 +247,25 @@ class AiAssistCompleter(Completer):
                         )
                 return  # Don't continue to other completions
 
-            # Check if this looks like a prompt command (has a slash in it)
-            parts = word.lstrip("/").split("/")
-
-            # Completing MCP prompts: /server/prompt
-            if len(parts) == 2 and self.agent and parts[0] != "skill":
-                server_name, prompt_prefix = parts
-
-                # If we have prompts from this server
-                if server_name in self.agent.available_prompts:
-                    for prompt_name, prompt in self.agent.available_prompts[server_name].items():
-                        if prompt_name.startswith(prompt_prefix.lower()):
-                            full_command = f"/{server_name}/{prompt_name}"
-                            yield Completion(
-                                full_command,
-                                start_position=-len(word),
-                                display=full_command,
-                                display_meta=prompt.description[:60] if prompt.description else "MCP prompt",
-                            )
-
-            # Completing server names: /server
-            elif len(parts) == 1 and self.agent and self.agent.available_prompts:
-                # Suggest server names that have prompts, plus all their prompts
-                for server_name in self.agent.available_prompts.keys():
-                    server_cmd = f"/{server_name}/"
-                    if server_cmd.startswith(word.lower()):
-                        yield Completion(
-                            server_cmd,
-                            start_position=-len(word),
-                            display=server_cmd,
-                            display_meta=f"MCP server ({len(self.agent.available_prompts[server_name])} prompts)",
-                        )
-                        # Also yield individual prompt completions for direct access
-                        for prompt_name, prompt in self.agent.available_prompts[server_name].items():
-                            full_command = f"/{server_name}/{prompt_name}"
-                            yield Completion(
-                                full_command,
-                                start_position=-len(word),
-                                display=full_command,
-                                display_meta=prompt.description[:60] if prompt.description else "MCP prompt",
-                            )
+            # MCP prompts (/server/prompt) and servers (/server)
+            if self.agent:
+                yield from self._get_prompt_completions(word)
 
             # Standard command completion
-            for cmd in self.commands:
-                if cmd.startswith(word.lower()):
-                    # Yield the remainder of the command
-                    yield Completion(
-                        cmd, start_position=-len(word), display=cmd, display_meta=self._get_command_description(cmd)
-                    )
+            matches = _prefix_matches(self._sorted_commands, word_lower)
+            for cmd in sorted(matches, key=self._command_order.__getitem__):
+                # Yield the remainder of the command
+                yield Completion(
+                    cmd, start_position=-len(word), display=cmd, display_meta=self._get_command_description(cmd)
+                )
         else:
             # Mid-sentence: check if cursor is on a /server/prompt token
-            words = text.split()
-            if not words:
-                return
-            last_word = words[-1]
             if not last_word.startswith("/"):
                 return
             # Only complete MCP prompts mid-sentence, not built-in commands
-            if not self.agent or not self.agent.available_prompts:
-                return
-
-            parts = last_word.lstrip("/").split("/")
-
-            if len(parts) == 2 and parts[0] != "skill":
-                server_name, prompt_prefix = parts
-                if server_name in self.agent.available_prompts:
-                    for prompt_name, prompt in self.agent.available_prompts[server_name].items():
-                        if prompt_name.startswith(prompt_prefix.lower()):
-                            full_token = f"/{server_name}/{prompt_name}"
-                            yield Completion(
-                                full_token,
-                                start_position=-len(last_word),
-                                display=full_token,
-                                display_meta=prompt.description[:60] if prompt.description else "MCP prompt",
-                            )
-            elif len(parts) == 1:
-                for server_name in self.agent.available_prompts.keys():
-                    server_cmd = f"/{server_name}/"
-                    if server_cmd.startswith(last_word.lower()):
-                        yield Completion(
-                            server_cmd,
-                            start_position=-len(last_word),
-                            display=server_cmd,
-                            display_meta=f"MCP server ({len(self.agent.available_prompts[server_name])} prompts)",
-                        )
-                        # Also yield individual prompt completions
-                        for prompt_name, prompt in self.agent.available_prompts[server_name].items():
-                            full_token = f"/{server_name}/{prompt_name}"
-                            yield Completion(
-                                full_token,
-                                start_position=-len(last_word),
-                                display=full_token,
-                                display_meta=prompt.description[:60] if prompt.description else "MCP prompt",
-                            )
+            if self.agent:
+                yield from self._get_prompt_completions(last_word)
 
     def _get_command_description(self, command: str) -> str:
         """Get description for a command"""
-        descriptions = {
-            "/status": "Show state statistics",
-            "/history": "Show recent monitoring history",
-            "/clear-cache": "Clear expired cache",
-            "/clear": "Clear conversation memory",
-            "/kg-save": "Toggle knowledge graph auto-save",
-            "/kg-viz": "Visualize knowledge graph in browser",
-            "/awl-viz": "Visualize an AWL workflow in browser",
-            "/prompts": "List available MCP prompts",
-            "/search": "Search conversation history",
-            "/skill/install": "Install an Agent Skill from git, local path, or ClawHub",
-            "/skill/uninstall": "Uninstall an installed Agent Skill",
-            "/skill/list": "List all installed Agent Skills",
-            "/skill/search": "Search ClawHub and skills.sh for skills",
-            "/skill/add_env": "Allow an env var for a skill's scripts",
-            "/skill/remove_env": "Remove an allowed env var from a skill",
-            "/skill/list_env": "Show allowed env vars for skills",
-            "/mcp/restart": "Restart an MCP server",
-            "/exit": "Exit interactive mode",
-            "/quit": "Exit interactive mode",
-            "/help": "Show help message",
-        }
-        return descriptions.get(command, "")
+        return self.COMMAND_DESCRIPTIONS.get(command, "")
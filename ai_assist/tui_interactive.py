@@ -1,24 +1,25 @@
 """TUI-enhanced interactive mode for ai-assist"""
 
 import asyncio
+import functools
 import json
 import logging
 import os
+import re
 import sys
 import threading
 import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, BinaryIO, ClassVar
 
 from prompt_toolkit import PromptSession
 from prompt_toolkit.filters import has_completions
 from prompt_toolkit.history import FileHistory
 from prompt_toolkit.key_binding import KeyBindings
-from rich.console import Console
-from rich.markdown import Markdown
+from rich.console import Console, Group
 from rich.panel import Panel
-from rich.table import Table
 
 from .agent import AiAssistAgent
 from .commands import get_command_suggestion, is_valid_interactive_command
@@ -30,60 +31,136 @@ from .file_watchdog import FileWatchdog
 from .identity import get_identity
 from .knowledge_graph import KnowledgeGraph
 from .main import reset_terminal_title, set_terminal_title
-from .prompt_utils import extract_prompt_messages
+from .notification_channels import LEVEL_COLORS, LEVEL_ICONS
+from .prompt_utils import extract_prompt_messages, prompt_arguments
 from .state import StateManager
 from .tui import AiAssistCompleter, format_tool_display_name
 
+try:
+    import termios
+    import tty
+except ImportError:
+    termios = None  # type: ignore[assignment]
+    tty = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    # Only needed by /help, /prompts and /eval-stats; imported there on first use
+    from rich.markdown import Markdown
+    from rich.table import Table
+
 logger = logging.getLogger(__name__)
 
+# Accepted /kg-save arguments (matched against the lowered input)
+_KG_SAVE_ON = frozenset({"on", "true", "1", "yes"})
+_KG_SAVE_OFF = frozenset({"off", "false", "0", "no"})
 
-async def display_notification(console: Console, notification: dict):
-    """Display a notification in the TUI"""
-    # Icon based on level
-    icons = {
-        "info": "ℹ️",
-        "success": "✅",
-        "warning": "⚠️",
-        "error": "❌",
-    }
-    icon = icons.get(notification.get("level", "info"), "🔔")
-
-    # Color based on level
-    colors = {
-        "info": "cyan",
-        "success": "green",
-        "warning": "yellow",
-        "error": "red",
-    }
-    color = colors.get(notification.get("level", "info"), "white")
 
-    panel = Panel(
+def build_notification_panel(notification: dict) -> Panel:
+    """Build the panel shown for a notification"""
+    level = notification.get("level", "info")
+    icon = LEVEL_ICONS.get(level, "🔔")
+    color = LEVEL_COLORS.get(level, "white")
+
+    return Panel(
         f"{notification['message']}\n\n[dim]{notification['timestamp']}[/dim]",
         title=f"{icon} {notification['title']}",
         border_style=color,
     )
 
-    console.print("\n")
-    console.print(panel)
-    console.print("\n")
+
+async def display_notifications(console: Console, notifications: list[dict]):
+    """Display a batch of notifications in the TUI with a single print"""
+    renderables: list[Any] = []
+    for notification in notifications:
+        renderables.extend(("\n", build_notification_panel(notification), "\n"))
+    if renderables:
+        console.print(Group(*renderables))
+
+
+async def display_notification(console: Console, notification: dict):
+    """Display a notification in the TUI"""
+    await display_notifications(console, [notification])
+
+
+@functools.lru_cache(maxsize=4)
+def build_welcome_panel(greeting: str, skills_count: int) -> Panel:
+    """Build the welcome banner (cached, it only depends on the greeting and installed skills count)"""
+    skills_status = (
+        f"[dim]🚀 {skills_count} Agent Skills loaded[/dim]\n"
+        if skills_count
+        else "[dim]💡 Install Agent Skills with /skill/install[/dim]\n"
+    )
+    return Panel.fit(
+        f"[bold cyan]ai-assist - {greeting}[/bold cyan]\n\n"
+        "Type your questions or commands.\n"
+        "Commands: [yellow]/status[/yellow], [yellow]/history[/yellow], "
+        "[yellow]/clear-cache[/yellow], [yellow]/kg-save[/yellow], [yellow]/prompts[/yellow], "
+        "[yellow]/skill/list[/yellow], [yellow]/help[/yellow]\n"
+        "Type [yellow]/exit[/yellow] or [yellow]/quit[/yellow] to exit\n\n"
+        "[dim]🧠 Auto-learning enabled - Tool results saved to knowledge graph[/dim]\n"
+        "[dim]🎯 MCP prompts available - Use /prompts to see them[/dim]\n"
+        f"{skills_status}"
+        "[dim]Press Enter to submit • Esc-Enter for multi-line • Escape to cancel • Tab for completion[/dim]",
+        border_style="cyan",
+    )
 
 
 class NotificationWatcher:
     """Watch notification log and display new notifications in TUI"""
 
-    def __init__(self, console: Console):
+    # Pending notifications kept while the printer is busy; older ones are dropped beyond this
+    QUEUE_SIZE: ClassVar[int] = 1024
+
+    def __init__(self, console: Console, debounce_window: float = 0.1, max_latency: float = 0.5):
         self.console = console
+        # A lone notification is shown at once; a flood of appends that follows it is
+        # coalesced, but never delays display by more than max_latency
+        self.debounce_window = debounce_window
+        self.max_latency = max_latency
         from .config import get_reports_dir
 
         self.notification_log = get_reports_dir() / "notifications.jsonl"
         self.watchdog: FileWatchdog | None = None
         self.last_position = 0
+        # Serializes reads so overlapping change events don't consume the same lines twice
+        self._read_lock = asyncio.Lock()
+        # Parsed notifications waiting for the printer task, so file events never wait on rendering
+        self._queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self._printer: asyncio.Task | None = None
+        self._log_file: BinaryIO | None = None
+
+    async def initialize(self):
+        """Skip notifications already in the log, without blocking the event loop"""
+        self.last_position = await asyncio.to_thread(self._end_position)
+
+    def _end_position(self) -> int:
+        try:
+            return self.notification_log.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _read_new_lines(self, position: int) -> tuple[list[bytes], int]:
+        """Read complete lines appended after position (runs in a worker thread)
 
-        # Initialize last position to end of file
-        if self.notification_log.exists():
-            with open(self.notification_log) as f:
-                f.seek(0, 2)  # Seek to end
-                self.last_position = f.tell()
+        Returns the lines and the position just past the last complete line,
+        so a partially written entry is picked up on the next change.
+        """
+        stat = os.stat(self.notification_log)
+        if self._log_file is None or os.fstat(self._log_file.fileno()).st_ino != stat.st_ino:
+            # Keep the log open across changes; a new inode means it was rotated, so start over
+            if self._log_file is not None:
+                self._log_file.close()
+                position = 0
+            self._log_file = open(self.notification_log, "rb")  # Closed in stop()
+        if stat.st_size < position:
+            position = 0  # Truncated in place
+        if stat.st_size <= position:
+            return [], position
+        # Fetch the whole appended tail with a single read, then cut it at the last newline
+        self._log_file.seek(position)
+        data = self._log_file.read(stat.st_size - position)
+        end = data.rfind(b"\n") + 1
+        return data[:end].split(b"\n")[:-1], position + end
 
     async def on_file_change(self):
         """Called when notifications.log changes"""
@@ -91,33 +168,145 @@ class NotificationWatcher:
             return
 
         try:
-            with open(self.notification_log) as f:
-                # Seek to last known position
-                f.seek(self.last_position)
-
-                # Read new lines
-                new_lines = f.readlines()
-                self.last_position = f.tell()
-
-                # Display each new notification
-                for line in new_lines:
-                    try:
-                        notification = json.loads(line.strip())
-                        await display_notification(self.console, notification)
-                    except json.JSONDecodeError:
-                        pass  # Skip malformed lines
+            async with self._read_lock:
+                new_lines, self.last_position = await asyncio.to_thread(self._read_new_lines, self.last_position)
+
+            for line in new_lines:
+                try:
+                    notification = json.loads(line)
+                except ValueError:
+                    continue  # Skip malformed lines
+                if self._queue.full():
+                    self._queue.get_nowait()  # Drop the oldest rather than block the watcher
+                self._queue.put_nowait(notification)
         except Exception as e:
             logger.warning("Error reading notification log: %s", e)
 
+    async def _print_notifications(self):
+        """Display queued notifications, rendering whatever has piled up in one pass"""
+        while True:
+            notifications = [await self._queue.get()]
+            while not self._queue.empty():
+                notifications.append(self._queue.get_nowait())
+            try:
+                await display_notifications(self.console, notifications)
+            except Exception as e:
+                logger.warning("Error displaying notifications: %s", e)
+
     async def start(self):
         """Start watching notification log"""
-        self.watchdog = FileWatchdog(self.notification_log, self.on_file_change, debounce_seconds=0.1)
+        await self.initialize()
+        self._printer = asyncio.create_task(self._print_notifications())
+        self.watchdog = FileWatchdog(
+            self.notification_log,
+            self.on_file_change,
+            debounce_seconds=self.debounce_window,
+            max_wait_seconds=self.max_latency,
+            leading_edge=True,
+        )
         await self.watchdog.start()
 
     async def stop(self):
         """Stop watching notification log"""
         if self.watchdog:
             await self.watchdog.stop()
+        if self._printer:
+            self._printer.cancel()
+            try:
+                await self._printer
+            except asyncio.CancelledError:
+                pass
+            self._printer = None
+        if self._log_file:
+            self._log_file.close()
+            self._log_file = None
+
+
+# User turns that are only a greeting or a thank-you carry nothing worth recalling later
+_SMALL_TALK = re.compile(r"(hi|hello|hey|thanks|thank you|thx|bye|good(bye| morning| night))\W*", re.IGNORECASE)
+
+
+class ConversationSaver:
+    """Save conversation exchanges to the knowledge graph from a single background task
+
+    Exchanges are queued by the input loop and written in batches, so saving
+    never blocks the loop, the saver's own writes never overlap each other, and
+    each batch is committed once. Other users of the knowledge graph (the
+    agent, from the loop thread) are not serialized against it, and the
+    batch() commit deferral is instance-wide, so their writes made while a
+    batch runs are committed with it. Small talk and repeats of a recent
+    exchange are not saved.
+    """
+
+    BATCH_SIZE: ClassVar[int] = 20
+    RECENT_SIZE: ClassVar[int] = 32
+
+    def __init__(self, knowledge_graph: KnowledgeGraph):
+        self.knowledge_graph = knowledge_graph
+        self._queue: asyncio.Queue[tuple[str, str, datetime]] = asyncio.Queue()
+        self._worker: asyncio.Task | None = None
+        self._recent: deque[int] = deque(maxlen=self.RECENT_SIZE)
+
+    def save(self, user: str, assistant: str) -> None:
+        """Queue an exchange for saving (never blocks the input loop)"""
+        if _SMALL_TALK.fullmatch(user.strip()):
+            return
+        key = self._key(user, assistant)
+        if key in self._recent:
+            return
+        self._recent.append(key)
+        self._queue.put_nowait((user, assistant, datetime.now()))
+
+    @staticmethod
+    def _key(user: str, assistant: str) -> int:
+        return hash((user.strip(), assistant.strip()))
+
+    def start(self):
+        """Start the background writer"""
+        self._worker = asyncio.create_task(self._save_exchanges())
+
+    async def stop(self):
+        """Write the exchanges still queued, then stop the background writer"""
+        if self._worker is None:
+            return
+        try:
+            await self._queue.join()
+        finally:
+            # Never leave the writer orphaned, even if waiting for the queue was cancelled
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _save_exchanges(self):
+        """Write queued exchanges, taking whatever has piled up (up to BATCH_SIZE) in one pass"""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.BATCH_SIZE and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await asyncio.to_thread(self._insert_exchanges, batch)
+            except Exception as e:
+                logger.warning("Error saving conversation to knowledge graph: %s", e)
+                # Unsaved exchanges must not count as recent, or a retry would be dropped as a repeat
+                for user, assistant, _ in batch:
+                    key = self._key(user, assistant)
+                    if key in self._recent:
+                        self._recent.remove(key)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _insert_exchanges(self, exchanges: list[tuple[str, str, datetime]]) -> None:
+        with self.knowledge_graph.batch():
+            for user, assistant, valid_from in exchanges:
+                self.knowledge_graph.insert_entity(
+                    entity_type="conversation",
+                    data={"user": user, "assistant": assistant},
+                    valid_from=valid_from,
+                )
 
 
 async def consume_streaming_response(
@@ -141,22 +330,26 @@ async def consume_streaming_response(
             progress_callback=progress_callback,
             cancel_event=cancel_event,
         ):
-            if isinstance(chunk, str):
+            # Text deltas dominate the stream: take them with a single exact type check
+            if type(chunk) is str:
                 renderer.show_text_delta(chunk)
                 full_response += chunk
-            elif isinstance(chunk, dict):
-                if chunk.get("type") == "tool_use":
-                    renderer.show_tool_call(chunk["name"], chunk.get("input", {}))
-                elif chunk.get("type") == "cancelled":
-                    renderer.stop()
-                    console.print("\n[yellow]Query cancelled[/yellow]")
-                    break
-                elif chunk.get("type") == "done":
-                    renderer.show_text_done()
-                    break
-                elif chunk.get("type") == "error":
-                    renderer.show_error(chunk.get("message", ""))
-                    break
+                continue
+            if not isinstance(chunk, dict):
+                continue
+            chunk_type = chunk.get("type")
+            if chunk_type == "tool_use":
+                renderer.show_tool_call(chunk["name"], chunk.get("input", {}))
+            elif chunk_type == "cancelled":
+                renderer.stop()
+                console.print("\n[yellow]Query cancelled[/yellow]")
+                break
+            elif chunk_type == "done":
+                renderer.show_text_done()
+                break
+            elif chunk_type == "error":
+                renderer.show_error(chunk.get("message", ""))
+                break
     except Exception as e:
         renderer.show_error(str(e))
     finally:
@@ -229,8 +422,9 @@ async def query_with_feedback(
             limits = agent.get_truncation_limits()
             truncate_large_messages(messages, limits["max_message_chars"])
 
-            if len(conversation_memory) > 0:
-                console.print(f"[dim]💬 Using context from {len(conversation_memory)} previous exchange(s)[/dim]")
+            history_len = len(conversation_memory)
+            if history_len > 0:
+                console.print(f"[dim]💬 Using context from {history_len} previous exchange(s)[/dim]")
         else:
             messages = None
 
@@ -421,6 +615,12 @@ def _handle_skill_list_env(parts: list[str], agent: AiAssistAgent, console: Cons
             console.print(f"[bold]{name}[/bold]: {', '.join(env_vars)}")
 
 
+@functools.cache
+def _arg_prompt_session() -> PromptSession:
+    """Session used to collect MCP prompt arguments, created on first use and kept for the process"""
+    return PromptSession()
+
+
 async def handle_prompt_command(
     command: str, agent: AiAssistAgent, conversation_history: list, console: Console, prompt_session: PromptSession
 ) -> bool:
@@ -431,12 +631,11 @@ async def handle_prompt_command(
     """
     # Parse /server/prompt pattern
     # Must be exactly 2 parts to avoid conflicts with built-in commands
-    parts = command.strip("/").split("/")
-
-    if len(parts) != 2:
+    path = command.strip("/")
+    if path.count("/") != 1:
         return False  # Not a prompt command (could be /status, /help, etc.)
 
-    server_name, prompt_name = parts
+    server_name, _, prompt_name = path.partition("/")
 
     # Validate server exists (connected MCP server)
     if server_name not in agent.sessions:
@@ -462,18 +661,17 @@ async def handle_prompt_command(
 
     # Collect arguments if needed
     arguments = None
-    if hasattr(prompt_def, "arguments") and prompt_def.arguments:
+    prompt_args = prompt_arguments(prompt_def)
+    if prompt_args:
         console.print(f"\n[cyan]Prompt '{prompt_name}' requires arguments:[/cyan]")
         console.print("[dim]Press Enter without a value to cancel[/dim]\n")
 
         arguments = {}
 
-        # Create a separate session for argument collection to avoid state pollution
-        from prompt_toolkit import PromptSession as ArgPromptSession
-
-        arg_session: Any = ArgPromptSession()
+        # Use a separate session for argument collection to avoid state pollution
+        arg_session = _arg_prompt_session()
 
-        for arg in prompt_def.arguments:
+        for arg in prompt_args:
             # Use plain text for prompt_toolkit (no Rich markup)
             required_marker = "*" if arg.required else ""
 
@@ -506,20 +704,19 @@ async def handle_prompt_command(
         # Convert prompt messages to conversation messages
         prompt_content = extract_prompt_messages(result, conversation_history)
 
-        # Display prompt content to user
-        console.print(
-            Panel(
-                (
-                    f"[green]Injected prompt: {prompt_name}[/green]\n"
-                    f"From: {server_name}\n"
-                    f"Messages added: {len(result.messages)}\n\n"
-                    f"[dim]{prompt_content[0][:200]}...[/dim]"
-                    if prompt_content
-                    else ""
-                ),
-                title="Prompt Loaded",
+        # Display prompt content to user, previewing only the start of the first message
+        body = ""
+        if prompt_content:
+            from rich.markup import escape
+
+            preview = escape(prompt_content[0][:200])
+            body = (
+                f"[green]Injected prompt: {prompt_name}[/green]\n"
+                f"From: {server_name}\n"
+                f"Messages added: {len(result.messages)}\n\n"
+                f"[dim]{preview}...[/dim]"
             )
-        )
+        console.print(Panel(body, title="Prompt Loaded"))
 
     except Exception as e:
         console.print(f"[red]Error executing prompt: {e}[/red]")
@@ -527,6 +724,26 @@ async def handle_prompt_command(
     return True
 
 
+def _get_terminal_attrs() -> list | None:
+    """Return the tty attributes of stdin, or None when stdin is not a terminal (runs in a worker thread)"""
+    if termios is None:
+        return None
+    try:
+        return termios.tcgetattr(sys.stdin.fileno())
+    except termios.error, OSError:
+        return None
+
+
+def _set_terminal_attrs(attrs: list) -> None:
+    """Restore tty attributes saved by _get_terminal_attrs (runs in a worker thread)"""
+    if termios is None:
+        return
+    try:
+        termios.tcsetattr(sys.stdin.fileno(), termios.TCSANOW, attrs)
+    except termios.error, OSError:
+        pass
+
+
 async def tui_interactive_mode(agent: AiAssistAgent, state_manager: StateManager):
     """Run interactive mode with TUI enhancements"""
     agent.interactive_mode = True
@@ -535,17 +752,11 @@ async def tui_interactive_mode(agent: AiAssistAgent, state_manager: StateManager
     set_terminal_title(identity.assistant.nickname)
 
     # Save terminal state before prompt_toolkit changes it
-    saved_terminal_attrs = None
-    try:
-        import termios
-
-        saved_terminal_attrs = termios.tcgetattr(sys.stdin.fileno())
-    except ImportError, termios.error, OSError:
-        pass
+    saved_terminal_attrs = await asyncio.to_thread(_get_terminal_attrs)
 
     # Setup history file
     history_file = get_config_dir() / "interactive_history.txt"
-    history_file.parent.mkdir(parents=True, exist_ok=True)
+    await asyncio.to_thread(history_file.parent.mkdir, parents=True, exist_ok=True)
 
     # Create key bindings for better UX
     # - Enter submits the input (normal behavior)
@@ -584,37 +795,18 @@ async def tui_interactive_mode(agent: AiAssistAgent, state_manager: StateManager
     )
 
     # Display welcome banner
-    skills_status = (
-        f"[dim]🚀 {len(agent.skills_manager.installed_skills)} Agent Skills loaded[/dim]\n"
-        if agent.skills_manager.installed_skills
-        else "[dim]💡 Install Agent Skills with /skill/install[/dim]\n"
-    )
-
-    console.print(
-        Panel.fit(
-            f"[bold cyan]ai-assist - {identity.get_greeting()}[/bold cyan]\n\n"
-            "Type your questions or commands.\n"
-            "Commands: [yellow]/status[/yellow], [yellow]/history[/yellow], "
-            "[yellow]/clear-cache[/yellow], [yellow]/kg-save[/yellow], [yellow]/prompts[/yellow], "
-            "[yellow]/skill/list[/yellow], [yellow]/help[/yellow]\n"
-            "Type [yellow]/exit[/yellow] or [yellow]/quit[/yellow] to exit\n\n"
-            "[dim]🧠 Auto-learning enabled - Tool results saved to knowledge graph[/dim]\n"
-            "[dim]🎯 MCP prompts available - Use /prompts to see them[/dim]\n"
-            f"{skills_status}"
-            "[dim]Press Enter to submit • Esc-Enter for multi-line • Escape to cancel • Tab for completion[/dim]",
-            border_style="cyan",
-        )
-    )
+    console.print(build_welcome_panel(identity.get_greeting(), len(agent.skills_manager.installed_skills)))
 
     # Initialize conversation memory for context-aware responses
     conversation_memory = ConversationMemory(max_exchanges=10)
-    conversation_context: list[dict] = []  # For state manager persistence
+    # For state manager persistence; only the exchanges the next session restores are kept
+    conversation_context: deque[dict] = deque(maxlen=conversation_memory.max_exchanges)
 
     # Restore previous session context
     saved = state_manager.load_conversation_context("last_interactive_session")
     if saved and saved.get("messages"):
-        conversation_context = saved["messages"]
-        conversation_memory.load_exchanges(conversation_context)
+        conversation_context.extend(saved["messages"])
+        conversation_memory.load_exchanges(saved["messages"])
         console.print(f"[dim]Restored {len(conversation_memory)} exchange(s) from previous session[/dim]\n")
 
     # Enable agent introspection of conversation memory
@@ -628,13 +820,15 @@ async def tui_interactive_mode(agent: AiAssistAgent, state_manager: StateManager
         # If KG fails to load, disable enrichment
         kg_context = KnowledgeGraphContext(None)
 
-    # Start config watching (mcp_servers.yaml, identity.yaml, installed-skills.json)
-    config_watcher = ConfigWatcher(agent)
-    await config_watcher.start()
+    # Conversations are saved to the KG by one background writer instead of a task per turn
+    conversation_saver = None
+    if kg_context.knowledge_graph:
+        conversation_saver = ConversationSaver(kg_context.knowledge_graph)
 
-    # Start notification watching for cross-process notifications
+    # Config watching (mcp_servers.yaml, identity.yaml, installed-skills.json) and
+    # notification watching for cross-process notifications (started with the loop below)
+    config_watcher = ConfigWatcher(agent)
     notification_watcher = NotificationWatcher(console)
-    await notification_watcher.start()
 
     # Inner execution uses the agent's renderer (set by query_with_feedback)
     agent.on_inner_execution = agent.renderer.on_inner_execution
@@ -682,10 +876,7 @@ async def tui_interactive_mode(agent: AiAssistAgent, state_manager: StateManager
 
         def _raw_input(prompt_text: str) -> str:
             """Read input with Escape/Ctrl-C support using cbreak mode."""
-            try:
-                import termios
-                import tty
-            except ImportError:
+            if termios is None:
                 # Fallback to regular input on non-Unix
                 return input(prompt_text)
 
@@ -807,7 +998,36 @@ async def tui_interactive_mode(agent: AiAssistAgent, state_manager: StateManager
     agent.filesystem_tools.confirmation_callback = command_confirmation_callback
     agent.filesystem_tools.path_confirmation_callback = path_confirmation_callback
 
+    # Clock for exchange timestamps, looked up once for the whole session
+    loop = asyncio.get_running_loop()
+
+    async def clear_conversation():
+        conversation_memory.clear()
+        conversation_context.clear()
+        state_manager.save_conversation_context("last_interactive_session", {"messages": []})
+        console.print("\n[green]✓ Conversation memory cleared[/green]\n")
+
+    # Built-in commands without arguments, dispatched on the lowercased input
+    simple_commands = {
+        "/prompts": lambda: handle_prompts_command(agent, console),
+        "/status": lambda: handle_status_command(state_manager, console),
+        "/history": lambda: handle_history_command(state_manager, console),
+        "/clear-cache": lambda: handle_clear_cache_command(state_manager, console),
+        "/help": lambda: handle_help_command(console),
+        "/clear": clear_conversation,
+        "/kg-viz": lambda: handle_kg_viz_command(kg_context.knowledge_graph if kg_context else None, console),
+        "/eval-stats": lambda: handle_eval_stats_command(console),
+    }
+
     try:
+        # Background work starts inside the try so the finally cleans up after a partial start
+        if conversation_saver:
+            conversation_saver.start()
+        results = await asyncio.gather(config_watcher.start(), notification_watcher.start(), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("Error starting watcher: %s", result)
+
         while True:
             try:
                 user_input = await session.prompt_async()
@@ -816,13 +1036,19 @@ async def tui_interactive_mode(agent: AiAssistAgent, state_manager: StateManager
                 if not user_input:
                     continue
 
-                if user_input.lower() in ["/exit", "/quit"]:
+                command = user_input.lower()
+                if command in ("/exit", "/quit"):
                     state_manager.save_conversation_context(
-                        "last_interactive_session", {"messages": conversation_context}
+                        "last_interactive_session", {"messages": list(conversation_context)}
                     )
                     console.print("\n[cyan]Goodbye![/cyan]")
                     break
 
+                handler = simple_commands.get(command)
+                if handler:
+                    await handler()
+                    continue
+
                 # Handle slash commands
                 if user_input.startswith("/"):
                     # Try skill management commands: /skill/install, /skill/uninstall, /skill/list
@@ -830,7 +1056,7 @@ async def tui_interactive_mode(agent: AiAssistAgent, state_manager: StateManager
                         continue
 
                     # Handle /mcp/restart before prompt command (which would parse it as /mcp/restart)
-                    if user_input.lower().startswith("/mcp/restart"):
+                    if command.startswith("/mcp/restart"):
                         parts = user_input.split(maxsplit=1)
                         if len(parts) < 2 or not parts[1].strip():
                             console.print("[yellow]Usage: /mcp/restart <server_name>[/yellow]")
@@ -866,9 +1092,12 @@ async def tui_interactive_mode(agent: AiAssistAgent, state_manager: StateManager
                         # Trim total if needed
                         total_chars = sum(len(str(m.get("content", ""))) for m in messages)
                         if total_chars > MAX_TOTAL_MESSAGE_CHARS and len(messages) > 2:
-                            while total_chars > MAX_TOTAL_MESSAGE_CHARS and len(messages) > 2:
-                                messages.pop(0)
-                                total_chars = sum(len(str(m.get("content", ""))) for m in messages)
+                            # Drop the oldest messages, keeping a running total instead of re-summing
+                            dropped = 0
+                            while total_chars > MAX_TOTAL_MESSAGE_CHARS and len(messages) - dropped > 2:
+                                total_chars -= len(str(messages[dropped].get("content", "")))
+                                dropped += 1
+                            del messages[:dropped]
                             console.print(
                                 f"[dim]Trimmed messages to fit context window: {total_chars:,} / {MAX_TOTAL_MESSAGE_CHARS:,} chars[/dim]"
                             )
@@ -946,79 +1175,36 @@ async def tui_interactive_mode(agent: AiAssistAgent, state_manager: StateManager
                                     {
                                         "user": user_input,  # Original /dci/rca command
                                         "assistant": full_response,
-                                        "timestamp": str(asyncio.get_event_loop().time()),
+                                        "timestamp": str(loop.time()),
                                     }
                                 )
 
-                            # Save to knowledge graph for cross-session memory (fire-and-forget)
-                            if kg_context and kg_context.knowledge_graph:
-
-                                async def _save_conv2(kg=kg_context.knowledge_graph, u=user_input, r=full_response):
-                                    try:
-                                        await asyncio.to_thread(
-                                            kg.insert_entity,
-                                            entity_type="conversation",
-                                            data={"user": u, "assistant": r},
-                                            valid_from=datetime.now(),
-                                        )
-                                    except Exception:
-                                        pass
-
-                                asyncio.create_task(_save_conv2())
+                            # Save to knowledge graph for cross-session memory (written in the background)
+                            if conversation_saver:
+                                conversation_saver.save(user_input, full_response)
 
                         except Exception as e:
                             console.print(f"\n[red]Error: {e}[/red]\n")
 
                         continue
 
-                # Handle commands
-                if user_input.lower() == "/prompts":
-                    await handle_prompts_command(agent, console)
-                    continue
-
-                if user_input.lower().startswith("/prompt-info "):
+                # Handle commands with arguments
+                if command.startswith("/prompt-info "):
                     prompt_ref = user_input[13:].strip()  # Remove "/prompt-info "
                     await handle_prompt_info_command(agent, console, prompt_ref)
                     continue
 
-                if user_input.lower() == "/status":
-                    await handle_status_command(state_manager, console)
-                    continue
-
-                if user_input.lower() == "/history":
-                    await handle_history_command(state_manager, console)
-                    continue
-
-                if user_input.lower() == "/clear-cache":
-                    await handle_clear_cache_command(state_manager, console)
-                    continue
-
-                if user_input.lower() == "/help":
-                    await handle_help_command(console)
-                    continue
-
-                if user_input.lower() == "/clear":
-                    conversation_memory.clear()
-                    conversation_context.clear()
-                    state_manager.save_conversation_context("last_interactive_session", {"messages": []})
-                    console.print("\n[green]✓ Conversation memory cleared[/green]\n")
-                    continue
-
-                if user_input.lower() == "/kg-viz":
-                    await handle_kg_viz_command(kg_context.knowledge_graph if kg_context else None, console)
-                    continue
-
-                if user_input.lower().startswith("/awl-viz"):
+                if command.startswith("/awl-viz"):
                     await handle_awl_viz_command(user_input, console)
                     continue
 
-                if user_input.lower().startswith("/kg-save"):
-                    parts = user_input.split()
+                if command.startswith("/kg-save"):
+                    parts = command.split(maxsplit=2)
                     if len(parts) > 1:
-                        if parts[1].lower() in ["on", "true", "1", "yes"]:
+                        if parts[1] in _KG_SAVE_ON:
                             agent.kg_save_enabled = True
                             console.print("\n[green]✓ Knowledge graph auto-save enabled[/green]\n")
-                        elif parts[1].lower() in ["off", "false", "0", "no"]:
+                        elif parts[1] in _KG_SAVE_OFF:
                             agent.kg_save_enabled = False
                             console.print("\n[yellow]Knowledge graph auto-save disabled[/yellow]\n")
                         else:
@@ -1028,10 +1214,6 @@ async def tui_interactive_mode(agent: AiAssistAgent, state_manager: StateManager
                         console.print(f"\n[cyan]Knowledge graph auto-save is currently {status}[/cyan]\n")
                     continue
 
-                if user_input.lower() == "/eval-stats":
-                    await handle_eval_stats_command(console)
-                    continue
-
                 # Validate command before sending to agent
                 if not is_valid_interactive_command(user_input):
                     error_msg = get_command_suggestion(user_input, is_interactive=True)
@@ -1076,25 +1258,13 @@ async def tui_interactive_mode(agent: AiAssistAgent, state_manager: StateManager
                             {
                                 "user": user_input,
                                 "assistant": response,
-                                "timestamp": str(asyncio.get_event_loop().time()),
+                                "timestamp": str(loop.time()),
                             }
                         )
 
-                    # Save to knowledge graph for cross-session memory (fire-and-forget)
-                    if kg_context and kg_context.knowledge_graph:
-
-                        async def _save_conv(kg=kg_context.knowledge_graph, u=user_input, r=response):
-                            try:
-                                await asyncio.to_thread(
-                                    kg.insert_entity,
-                                    entity_type="conversation",
-                                    data={"user": u, "assistant": r},
-                                    valid_from=datetime.now(),
-                                )
-                            except Exception:
-                                pass
-
-                        asyncio.create_task(_save_conv())
+                    # Save to knowledge graph for cross-session memory (written in the background)
+                    if conversation_saver:
+                        conversation_saver.save(user_input, response)
 
                 except KeyboardInterrupt:
                     console.print("\n[yellow]Query cancelled[/yellow]")
@@ -1105,24 +1275,27 @@ async def tui_interactive_mode(agent: AiAssistAgent, state_manager: StateManager
                     console.print(f"\n[red]Error: {e}[/red]\n")
 
             except EOFError, KeyboardInterrupt:
-                state_manager.save_conversation_context("last_interactive_session", {"messages": conversation_context})
+                state_manager.save_conversation_context(
+                    "last_interactive_session", {"messages": list(conversation_context)}
+                )
                 console.print("\n[cyan]Goodbye![/cyan]")
                 break
             except Exception as e:
                 console.print(f"[red]Error: {e}[/red]\n")
     finally:
-        # Stop watchers on exit
-        await config_watcher.stop()
-        await notification_watcher.stop()
+        # Finish pending KG writes on exit, outside the watcher shutdown so a failing watcher can't cancel it
+        if conversation_saver:
+            await conversation_saver.stop()
+
+        # Stop watchers concurrently; a failure in one must not skip the other or the terminal restore
+        results = await asyncio.gather(config_watcher.stop(), notification_watcher.stop(), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("Error stopping watcher: %s", result)
 
         # Restore terminal to the state saved before prompt_toolkit modified it
         if saved_terminal_attrs is not None:
-            try:
-                import termios
-
-                termios.tcsetattr(sys.stdin.fileno(), termios.TCSANOW, saved_terminal_attrs)
-            except ImportError, termios.error, OSError:
-                pass
+            await asyncio.to_thread(_set_terminal_attrs, saved_terminal_attrs)
         reset_terminal_title()
 
 
@@ -1148,7 +1321,8 @@ async def handle_history_command(state_manager: StateManager, console: Console):
 
 async def handle_clear_cache_command(state_manager: StateManager, console: Console):
     """Handle /clear-cache command"""
-    removed = state_manager.cleanup_expired_cache()
+    # Sweeping the cache directory is file I/O; keep it off the event loop
+    removed = await asyncio.to_thread(state_manager.cleanup_expired_cache)
     console.print(f"\n[green]Cleared {removed} cache entries[/green]\n")
 
 
@@ -1158,33 +1332,42 @@ async def handle_prompts_command(agent: AiAssistAgent, console: Console):
         console.print("[yellow]No prompts available from MCP servers[/yellow]\n")
         return
 
+    # The agent drops its prompts views whenever the prompts change, so a stored table is current
+    table = agent.prompts_views.get("table")
+    if table is None:
+        table = agent.prompts_views["table"] = _build_prompts_table(agent.available_prompts)
+
+    console.print(table)
+    console.print("\n[dim]* = required argument[/dim]")
+    console.print("[dim]Use /server/prompt to execute (e.g., /dci/rca)[/dim]\n")
+
+
+def _build_prompts_table(available_prompts: dict) -> Table:
+    """Build the /prompts listing table"""
+    from rich.table import Table
+
     table = Table(title="Available MCP Prompts")
     table.add_column("Command", style="cyan")
     table.add_column("Server", style="green")
     table.add_column("Description", style="white")
     table.add_column("Arguments", style="yellow")
 
-    for server_name, prompts in agent.available_prompts.items():
+    for server_name, prompts in available_prompts.items():
         for prompt_name, prompt in prompts.items():
             command = f"/{server_name}/{prompt_name}"
             description = prompt.description or "(no description)"
 
             # Format arguments
-            args_list = []
-            if hasattr(prompt, "arguments") and prompt.arguments:
-                for arg in prompt.arguments:
-                    arg_name = arg.name
-                    if arg.required:
-                        args_list.append(f"{arg_name}* (required)")
-                    else:
-                        args_list.append(f"{arg_name} (optional)")
-
-            args_display = "\n".join(args_list) if args_list else "-"
+            args_display = (
+                "\n".join(
+                    f"{arg.name}* (required)" if arg.required else f"{arg.name} (optional)"
+                    for arg in prompt_arguments(prompt)
+                )
+                or "-"
+            )
             table.add_row(command, server_name, description, args_display)
 
-    console.print(table)
-    console.print("\n[dim]* = required argument[/dim]")
-    console.print("[dim]Use /server/prompt to execute (e.g., /dci/rca)[/dim]\n")
+    return table
 
 
 async def handle_prompt_info_command(agent: AiAssistAgent, console: Console, prompt_ref: str):
@@ -1213,33 +1396,42 @@ async def handle_prompt_info_command(agent: AiAssistAgent, console: Console, pro
     # Get prompt definition
     prompt_def = agent.available_prompts[server_name][prompt_name]
 
-    # Display prompt information
-    console.print(f"\n[bold cyan]Prompt: {server_name}/{prompt_name}[/bold cyan]")
-    console.print(f"[dim]MCP format: mcp://{server_name}/{prompt_name}[/dim]\n")
+    # Display prompt information, collected into a single print
+    lines = [
+        f"\n[bold cyan]Prompt: {server_name}/{prompt_name}[/bold cyan]",
+        f"[dim]MCP format: mcp://{server_name}/{prompt_name}[/dim]\n",
+    ]
 
     if prompt_def.description:
-        console.print(f"[white]{prompt_def.description}[/white]\n")
-
-    # Display arguments
-    if hasattr(prompt_def, "arguments") and prompt_def.arguments:
-        console.print("[bold yellow]Arguments:[/bold yellow]")
-        for arg in prompt_def.arguments:
-            required = "[red]REQUIRED[/red]" if arg.required else "[dim]optional[/dim]"
-            console.print(f"  • [cyan]{arg.name}[/cyan] ({required})")
+        lines.append(f"[white]{prompt_def.description}[/white]\n")
+
+    # Display arguments, collecting the required ones for the example in the same pass
+    prompt_args = prompt_arguments(prompt_def)
+    example_args = {}
+    if prompt_args:
+        lines.append("[bold yellow]Arguments:[/bold yellow]")
+        for arg in prompt_args:
+            if arg.required:
+                required = "[red]REQUIRED[/red]"
+                example_args[arg.name] = f"<{arg.name}>"
+            else:
+                required = "[dim]optional[/dim]"
+            lines.append(f"  • [cyan]{arg.name}[/cyan] ({required})")
             if arg.description:
-                console.print(f"    [dim]{arg.description}[/dim]")
-        console.print()
+                lines.append(f"    [dim]{arg.description}[/dim]")
+        lines.append("")
     else:
-        console.print("[dim]No arguments required[/dim]\n")
+        lines.append("[dim]No arguments required[/dim]\n")
 
     # Show example usage
-    console.print("[bold]Example Usage:[/bold]")
-    console.print(f"[dim]Interactive:[/dim] /{server_name}/{prompt_name}")
-    if hasattr(prompt_def, "arguments") and prompt_def.arguments:
-        example_args = {arg.name: f"<{arg.name}>" for arg in prompt_def.arguments if arg.required}
-        console.print(f"[dim]In task:[/dim] mcp://{server_name}/{prompt_name}")
-        console.print(f"[dim]Arguments:[/dim] {example_args}")
-    console.print()
+    lines.append("[bold]Example Usage:[/bold]")
+    lines.append(f"[dim]Interactive:[/dim] /{server_name}/{prompt_name}")
+    if prompt_args:
+        lines.append(f"[dim]In task:[/dim] mcp://{server_name}/{prompt_name}")
+        lines.append(f"[dim]Arguments:[/dim] {example_args}")
+    lines.append("")
+
+    console.print("\n".join(lines))
 
 
 async def handle_eval_stats_command(console: Console):
@@ -1257,6 +1449,8 @@ async def handle_eval_stats_command(console: Console):
 
     metrics = QueryEvaluator.evaluate_traces(traces)
 
+    from rich.table import Table
+
     table = Table(title=f"Evaluation Metrics ({metrics.total_queries} queries)")
     table.add_column("Metric", style="cyan")
     table.add_column("Value", style="green")
@@ -1342,9 +1536,7 @@ async def handle_awl_viz_command(user_input: str, console: Console):
         console.print("[dim]Cancelled[/dim]\n")
 
 
-async def handle_help_command(console: Console):
-    """Handle /help command"""
-    help_text = """
+_HELP_TEXT = """
 # ai-assist Interactive Mode Help
 
 ## Commands
@@ -1424,5 +1616,17 @@ ai-assist automatically saves tool results to the knowledge graph:
 - Responses are formatted as Markdown when possible
 - ai-assist remembers up to 10 recent exchanges for context
 """
-    console.print(Markdown(help_text))
+
+
+@functools.cache
+def _help_markdown() -> Markdown:
+    """Parse the static /help text once and reuse it"""
+    from rich.markdown import Markdown
+
+    return Markdown(_HELP_TEXT)
+
+
+async def handle_help_command(console: Console):
+    """Handle /help command"""
+    console.print(_help_markdown())
     console.print()
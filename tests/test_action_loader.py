@@ -8,6 +8,7 @@ import pytest
 
 from ai_assist.action_loader import ActionLoader
 from ai_assist.action_model import ActionDefinition
+from ai_assist.tasks import TaskLoader
 
 
 @pytest.fixture
@@ -102,6 +103,24 @@ class TestActionLoader:
         assert actions[0].name == "Valid"
         assert "Invalid" in caplog.text
 
+    def test_load_action_saved_with_legacy_interval(self, temp_json_file):
+        """Actions saved before intervals had a strict grammar still load with the same period"""
+        data = {
+            "version": "2.0",
+            "actions": [
+                {"name": "Reversed", "trigger": {"type": "interval", "every": "30m2h"}, "prompt": "Test"},
+                {"name": "Worded", "trigger": {"type": "interval", "every": "every 5min"}, "prompt": "Test"},
+            ],
+        }
+        temp_json_file.write_text(json.dumps(data))
+
+        loader = ActionLoader(temp_json_file)
+        actions = loader.load_actions()
+
+        assert [a.name for a in actions] == ["Reversed", "Worded"]
+        assert TaskLoader.parse_interval(actions[0].trigger["every"]) == 9000
+        assert TaskLoader.parse_interval(actions[1].trigger["every"]) == 300
+
     def test_load_corrupted_json(self, temp_json_file, caplog):
         temp_json_file.write_text("{bad json")
 
@@ -164,3 +164,14 @@ def test_evaluate_float_comparison():
     assert evaluator.evaluate("success_rate > 80", metadata) is True
     assert evaluator.evaluate("success_rate < 90", metadata) is True
     assert evaluator.evaluate("success_rate >= 85.5", metadata) is True
+
+
+def test_compile_condition_is_cached():
+    """Test that a condition string is parsed once and reused"""
+    from ai_assist.conditions import compile_condition
+
+    check = compile_condition("count > 5")
+
+    assert compile_condition("count > 5") is check
+    assert check({"count": 10}) is True
+    assert check({}) is False
@@ -231,6 +231,7 @@ async def test_restart_mcp_server():
 
     # Add mock prompts for this server
     agent.available_prompts["test-server"] = {"prompt1": MagicMock()}
+    agent._refresh_prompts_snapshot()
 
     # Add mock server task
     mock_task = MagicMock()
@@ -262,6 +263,7 @@ async def test_restart_mcp_server():
 
     # Verify prompts were cleaned
     assert "test-server" not in agent.available_prompts
+    assert agent._prompts_snapshot == ()
 
 
 @pytest.mark.asyncio
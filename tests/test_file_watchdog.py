@@ -1,21 +1,24 @@
 """Tests for OS-level file watching with watchdog library."""
 
 import asyncio
+import os
 import tempfile
 from pathlib import Path
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from ai_assist.file_watchdog import FileWatchdog, _shared_observers
+from ai_assist import file_watchdog as file_watchdog_module
+from ai_assist.file_watchdog import FileWatchdog, _DebounceHandler, _shared_watches
 
 
 @pytest.fixture(autouse=True)
-def _clean_shared_observers():
+def _clean_shared_observers(monkeypatch):
     """Ensure shared observer state is clean between tests."""
-    _shared_observers.clear()
+    monkeypatch.setattr(file_watchdog_module, "_shared_observer", None)
+    _shared_watches.clear()
     yield
-    _shared_observers.clear()
+    _shared_watches.clear()
 
 
 @pytest.mark.asyncio
@@ -232,8 +235,8 @@ async def test_multiple_watchers_same_directory():
         await watcher_b.start()
         await asyncio.sleep(0.2)
 
-        # Shared observer: one entry for this directory
-        assert len(_shared_observers) == 1
+        # Shared observer: one watch for this directory
+        assert len(_shared_watches) == 1
 
         # Modify only file_a
         file_a.write_text("a2")
@@ -250,8 +253,152 @@ async def test_multiple_watchers_same_directory():
 
         await watcher_a.stop()
         # Observer still alive for watcher_b
-        assert tmpdir in str(list(_shared_observers.keys()))
+        assert tmpdir in str(list(_shared_watches.keys()))
 
         await watcher_b.stop()
         # Observer released
-        assert len(_shared_observers) == 0
+        assert len(_shared_watches) == 0
+        assert file_watchdog_module._shared_observer is None
+
+
+@pytest.mark.asyncio
+async def test_watchers_in_different_directories_share_one_observer(tmp_path):
+    """Test that files in different directories are watched by the same Observer thread."""
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    file_a = tmp_path / "a" / "a.json"
+    file_b = tmp_path / "b" / "b.json"
+    file_a.write_text("a1")
+    file_b.write_text("b1")
+
+    callback_b = AsyncMock()
+    watcher_a = FileWatchdog(file_a, AsyncMock(), debounce_seconds=0.1)
+    watcher_b = FileWatchdog(file_b, callback_b, debounce_seconds=0.1)
+
+    await watcher_a.start()
+    observer = file_watchdog_module._shared_observer
+    await watcher_b.start()
+
+    assert file_watchdog_module._shared_observer is observer
+    assert len(_shared_watches) == 2
+
+    await watcher_a.stop()
+    assert observer.is_alive()
+
+    await asyncio.sleep(0.2)
+    file_b.write_text("b2")
+    await asyncio.sleep(0.3)
+    assert callback_b.call_count >= 1
+
+    await watcher_b.stop()
+    assert not observer.is_alive()
+
+
+def test_same_mtime_rewrite_detected_by_content_hash(tmp_path):
+    """A rewrite that keeps mtime and size (coarse NFS/CIFS timestamps) is still detected."""
+    test_file = tmp_path / "test.json"
+    test_file.write_text('{"test": 1}')
+    st = test_file.stat()
+    handler = _DebounceHandler(test_file, AsyncMock(), 0.1, MagicMock(), verify_content=True)
+
+    # The first ambiguous check has no earlier hash to compare with, so it errs on reporting a change
+    assert handler._file_changed() is True
+    assert handler._file_changed() is False
+
+    test_file.write_text('{"test": 2}')
+    os.utime(test_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert handler._file_changed() is True
+    assert handler._file_changed() is False
+
+
+def test_appends_are_detected_without_reading_the_file(tmp_path):
+    """A growing file (e.g. a JSONL log) is detected from its stat alone, and is never hashed by default."""
+    log_file = tmp_path / "notifications.jsonl"
+    log_file.write_text("{}\n")
+    handler = _DebounceHandler(log_file, AsyncMock(), 0.1, MagicMock())
+    handler._content_digest = MagicMock(side_effect=AssertionError("file content was read"))
+
+    assert handler._file_changed() is False
+
+    with open(log_file, "a") as f:
+        f.write("{}\n")
+
+    assert handler._file_changed() is True
+    assert handler._file_changed() is False
+
+
+@pytest.mark.asyncio
+async def test_max_wait_fires_during_continuous_changes():
+    """A burst that never pauses still triggers the callback once max_wait_seconds has passed."""
+    callback = AsyncMock()
+    handler = _DebounceHandler(
+        Path("unused"), callback, debounce_seconds=0.1, loop=asyncio.get_running_loop(), max_wait_seconds=0.2
+    )
+
+    # Changes every 50ms would keep resetting a plain 100ms debounce forever
+    for _ in range(10):
+        handler._schedule_callback()
+        await asyncio.sleep(0.05)
+    await handler.cancel_pending()
+
+    assert callback.call_count >= 1
+
+
+@pytest.mark.asyncio
+async def test_leading_edge_fires_first_change_immediately():
+    """With leading_edge, the first change fires at once and only the following burst is debounced."""
+    callback = AsyncMock()
+    handler = _DebounceHandler(
+        Path("unused"), callback, debounce_seconds=0.2, loop=asyncio.get_running_loop(), leading_edge=True
+    )
+
+    handler._schedule_callback()
+    await asyncio.sleep(0.01)
+    assert callback.call_count == 1
+
+    # Changes inside the window are coalesced into one trailing call
+    handler._schedule_callback()
+    handler._schedule_callback()
+    await asyncio.sleep(0.01)
+    assert callback.call_count == 1
+    await asyncio.sleep(0.3)
+    assert callback.call_count == 2
+
+    # After a quiet period, the next change is immediate again
+    await asyncio.sleep(0.25)
+    handler._schedule_callback()
+    await asyncio.sleep(0.01)
+    assert callback.call_count == 3
+    await handler.cancel_pending()
+
+
+@pytest.mark.asyncio
+async def test_leading_edge_callback_never_overlaps_trailing_one():
+    """Changes arriving while the leading callback runs are delivered after it, not alongside it."""
+    running = 0
+    peak = 0
+    calls = 0
+
+    async def slow_callback():
+        nonlocal running, peak, calls
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.3)
+        running -= 1
+        calls += 1
+
+    handler = _DebounceHandler(
+        Path("unused"), slow_callback, debounce_seconds=0.05, loop=asyncio.get_running_loop(), leading_edge=True
+    )
+
+    handler._schedule_callback()
+    await asyncio.sleep(0.1)
+    # Two changes while the leading callback is still running, past the debounce window
+    handler._schedule_callback()
+    handler._schedule_callback()
+    await asyncio.sleep(0.8)
+
+    assert calls == 2
+    assert peak == 1
+    await handler.cancel_pending()
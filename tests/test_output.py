@@ -1,6 +1,12 @@
 """Tests for unified OutputRenderer"""
 
-from ai_assist.output import PlainRenderer
+import io
+from unittest.mock import MagicMock
+
+from rich.console import Console
+from rich.markdown import Markdown
+
+from ai_assist.output import PlainRenderer, RichRenderer
 
 
 class TestPlainRenderer:
@@ -90,3 +96,38 @@ class TestPlainRenderer:
         renderer = PlainRenderer()
         result = renderer._format_args({"path": "/tmp/[test].log"})
         assert "path=/tmp/[test].log" in result
+
+    def test_format_tool_args_elides_past_budget(self):
+        """Arguments past the overall display budget are replaced by a single ellipsis"""
+        renderer = PlainRenderer()
+        result = renderer._format_args({f"arg{i}": "x" * 200 for i in range(50)})
+        assert result.startswith("arg0=" + "x" * 100 + "...")
+        assert result.endswith(", …")
+        assert result.count("=") == 4
+
+
+class TestRichRenderer:
+    def test_text_deltas_are_printed_once_on_done(self):
+        console = MagicMock()
+        renderer = RichRenderer(console)
+        for token in ["Hello", " ", "world", "!"] * 50:
+            renderer.show_text_delta(token)
+        printed_before_done = console.print.call_count
+
+        renderer.show_text_done()
+
+        assert console.print.call_count == printed_before_done + 1
+        (markdown,) = console.print.call_args.args
+        assert isinstance(markdown, Markdown)
+        assert markdown.markup == "Hello world!" * 50
+
+    def test_spinner_is_reused_across_tool_calls(self):
+        renderer = RichRenderer(Console(file=io.StringIO()))
+        renderer.start()
+        spinner = renderer._spinner
+
+        renderer.show_inner_tool_call("internal__read_file", {"path": "/tmp/log.txt"})
+
+        assert renderer._spinner is spinner
+        assert spinner.text.plain == "  executing prompt..."
+        renderer.stop()
@@ -0,0 +1,42 @@
+"""Tests for shared prompt handling utilities"""
+
+from types import SimpleNamespace
+
+from ai_assist.prompt_utils import PromptArgument, extract_prompt_messages, prompt_arguments
+
+
+def test_extract_prompt_messages_appends_history_in_order():
+    """Text content is used as-is, other content is stringified, and history keeps message order"""
+    result = SimpleNamespace(
+        messages=[
+            SimpleNamespace(role="user", content=SimpleNamespace(text="Analyze job 123")),
+            SimpleNamespace(role="assistant", content=42),
+        ]
+    )
+    history = [{"role": "user", "content": "earlier"}]
+
+    contents = extract_prompt_messages(result, history)
+
+    assert contents == ["Analyze job 123", "42"]
+    assert history == [
+        {"role": "user", "content": "earlier"},
+        {"role": "user", "content": "Analyze job 123"},
+        {"role": "assistant", "content": "42"},
+    ]
+
+
+def test_prompt_arguments_normalizes_definitions():
+    """Missing argument lists become empty tuples and optional fields get plain defaults"""
+    prompt = SimpleNamespace(
+        arguments=[
+            SimpleNamespace(name="job_id", required=True, description="DCI job"),
+            SimpleNamespace(name="verbose", required=None, description=None),
+        ]
+    )
+
+    assert prompt_arguments(prompt) == (
+        PromptArgument("job_id", True, "DCI job"),
+        PromptArgument("verbose", False, ""),
+    )
+    assert prompt_arguments(SimpleNamespace(arguments=None)) == ()
+    assert prompt_arguments(SimpleNamespace()) == ()
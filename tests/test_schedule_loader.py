@@ -389,3 +389,22 @@ class TestScheduleLoader:
         assert len(monitors) == 2
         assert monitors[0].is_event_triggered is False
         assert monitors[1].is_event_triggered is True
+
+    def test_null_conditions_and_channels_use_defaults(self, temp_json_file):
+        """Test that null conditions/notification_channels load like missing ones"""
+        entry = {"prompt": "Check", "interval": "5m", "conditions": None, "notification_channels": None}
+        data = {
+            "version": "1.0",
+            "monitors": [{"name": "Monitor", **entry}],
+            "tasks": [{"name": "Task", **entry}],
+        }
+        temp_json_file.write_text(json.dumps(data))
+
+        loader = ScheduleLoader(temp_json_file)
+        monitors = loader.load_monitors()
+        tasks = loader.load_tasks()
+
+        for task in (*monitors, *tasks):
+            assert task.conditions == ()
+            assert task.notification_channels == ("console",)
+        assert len(monitors) == len(tasks) == 1
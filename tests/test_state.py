@@ -0,0 +1,43 @@
+"""Tests for state management"""
+
+from ai_assist.state import StateManager
+
+
+def test_get_history_returns_last_entries(tmp_path):
+    """Test that get_history returns the most recent entries in order"""
+    state_manager = StateManager(state_dir=tmp_path / "state")
+    for i in range(20):
+        state_manager.append_history("monitor", {"run": i})
+
+    history = state_manager.get_history("monitor", limit=3)
+
+    assert [entry["result"]["run"] for entry in history] == [17, 18, 19]
+
+
+def test_get_history_reads_across_chunks(tmp_path):
+    """Test that entries spanning several read chunks are reassembled"""
+    state_manager = StateManager(state_dir=tmp_path / "state")
+    for i in range(50):
+        state_manager.append_history("monitor", {"run": i, "output": "x" * 1000})
+
+    history = state_manager.get_history("monitor", limit=10)
+
+    assert [entry["result"]["run"] for entry in history] == list(range(40, 50))
+
+
+def test_get_history_limit_larger_than_history(tmp_path):
+    """Test that a limit beyond the history size returns everything"""
+    state_manager = StateManager(state_dir=tmp_path / "state")
+    for i in range(3):
+        state_manager.append_history("monitor", {"run": i})
+
+    history = state_manager.get_history("monitor", limit=10)
+
+    assert [entry["result"]["run"] for entry in history] == [0, 1, 2]
+
+
+def test_get_history_missing_file(tmp_path):
+    """Test that a monitor without history returns an empty list"""
+    state_manager = StateManager(state_dir=tmp_path / "state")
+
+    assert state_manager.get_history("unknown") == []
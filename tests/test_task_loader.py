@@ -1,10 +1,11 @@
 """Tests for task definition loading"""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from ai_assist.tasks import TaskDefinition, TaskLoader
+from ai_assist.tasks import TaskDefinition, TaskLoader, TaskValidationError
 
 
 def test_parse_interval_seconds():
@@ -440,3 +441,173 @@ def test_is_interval_with_range_on_event_triggered():
         trigger={"type": "mqtt", "topic": "t"},
     )
     assert task.is_interval_with_range is False
+
+
+def test_interval_seconds_parsed_once():
+    """Simple intervals are parsed at construction, not on every access"""
+    task = TaskDefinition(name="Task", prompt="Test", interval="2h30m")
+
+    with patch.object(TaskLoader, "parse_interval", side_effect=AssertionError("re-parsed")):
+        assert task.interval_seconds == 9000
+        assert task.interval_seconds == 9000
+
+
+def test_task_definition_uses_slots():
+    """TaskDefinition instances carry no per-instance __dict__"""
+    task = TaskDefinition(name="Task", prompt="Test", interval="5m")
+
+    assert not hasattr(task, "__dict__")
+    with pytest.raises(AttributeError):
+        task.unknown = True  # type: ignore[attr-defined]
+
+
+def test_parse_interval_accepts_legacy_formats_with_warning(caplog):
+    """Test that intervals outside the h/m/s grammar still parse as before, with a warning"""
+    TaskLoader.parse_interval.cache_clear()
+    assert TaskLoader.parse_interval("1h 30m") == 5400
+    assert not caplog.records
+
+    legacy = {"every 5m": 300, "5min": 300, "30m2h": 9000, "1h1h": 3600, "1h30": 3600}
+    for interval, seconds in legacy.items():
+        assert TaskLoader.parse_interval(interval) == seconds
+    assert len(caplog.records) == len(legacy)
+    assert "deprecated format" in caplog.records[0].getMessage()
+
+
+def test_load_from_stream_accepts_binary_and_text():
+    """Test that load_from_stream parses both byte and text streams"""
+    import io
+
+    content = """
+tasks:
+  - name: "Café check"
+    interval: 5m
+    prompt: "Check"
+"""
+    loader = TaskLoader()
+
+    from_bytes = loader.load_from_stream(io.BytesIO(content.encode()))
+    from_text = loader.load_from_stream(io.StringIO(content))
+
+    assert from_bytes[0].name == from_text[0].name == "Café check"
+
+
+def test_default_collections_are_shared_tuples():
+    """Test that tasks without overrides share immutable default conditions and channels"""
+    loader = TaskLoader()
+    tasks = loader.load_from_yaml_string("""
+tasks:
+  - name: "Task 1"
+    interval: 5m
+    prompt: "First"
+  - name: "Task 2"
+    interval: 1h
+    prompt: "Second"
+    notification_channels: [desktop, file]
+""")
+
+    assert tasks[0].conditions == ()
+    assert tasks[0].notification_channels == ("console",)
+    assert tasks[0].notification_channels is TaskDefinition(name="x", prompt="y", interval="5m").notification_channels
+    assert tasks[1].notification_channels == ("desktop", "file")
+
+
+def test_parse_mcp_prompt_cached_at_construction():
+    """Test that a well-formed MCP prompt reference is parsed once when the task is created"""
+    task = TaskDefinition(name="Test", prompt="mcp://dci/rca", interval="5m")
+
+    with patch("ai_assist.tasks.parse_mcp_prompt", side_effect=AssertionError("re-parsed")):
+        assert task.is_mcp_prompt is True
+        assert task.parse_mcp_prompt() == ("dci", "rca")
+
+
+def test_parse_interval_rejects_strings_without_units():
+    """Test that strings with no h/m/s component are rejected"""
+    assert TaskLoader.parse_interval("1h 5m\t30s") == 3930
+
+    for interval in ("5 m", "30", "soon"):
+        with pytest.raises(ValueError, match="Invalid interval format"):
+            TaskLoader.parse_interval(interval)
+
+
+def test_load_reports_all_invalid_tasks():
+    """Test that every invalid task in a file is reported in one aggregated error"""
+    yaml_content = """
+tasks:
+  - name: "Bad Interval"
+    interval: "invalid"
+    prompt: "Test prompt"
+  - name: "Good Task"
+    interval: 5m
+    prompt: "Test prompt"
+  - name: "No Prompt"
+    interval: 5m
+"""
+    loader = TaskLoader()
+
+    with pytest.raises(TaskValidationError, match="2 invalid task definitions") as exc_info:
+        loader.load_from_yaml_string(yaml_content)
+
+    assert isinstance(exc_info.value, ValueError)
+    first, second = exc_info.value.exceptions
+    assert "Invalid interval" in str(first)
+    assert "Missing required field" in str(second)
+    assert first.__notes__ == ["in task 'Bad Interval'"]
+    message = str(exc_info.value)
+    assert "Invalid interval" in message
+    assert "in task 'Bad Interval'" in message
+    assert "in task 'No Prompt'" in message
+
+
+def test_null_conditions_and_channels_use_defaults():
+    """Test that empty conditions/notification_channels keys load like missing ones"""
+    loader = TaskLoader()
+    tasks = loader.load_from_yaml_string("""
+tasks:
+  - name: "Task 1"
+    interval: 5m
+    prompt: "First"
+    conditions:
+    notification_channels:
+""")
+
+    assert tasks[0].conditions == ()
+    assert tasks[0].notification_channels == ("console",)
+
+
+def test_empty_prompt_is_a_validation_error():
+    """Test that an empty prompt is reported as a validation error, not a crash"""
+    loader = TaskLoader()
+
+    with pytest.raises(TaskValidationError) as exc_info:
+        loader.load_from_yaml_string("""
+tasks:
+  - name: "No prompt"
+    interval: 5m
+    prompt:
+  - name: "Bad interval"
+    interval: "soon"
+    prompt: "Check"
+""")
+
+    message = str(exc_info.value)
+    assert "Task prompt is required (in task 'No prompt')" in message
+
+
+def test_non_string_interval_is_a_validation_error():
+    """Test that a non-string interval is reported as a validation error, not a crash"""
+    loader = TaskLoader()
+
+    with pytest.raises(TaskValidationError) as exc_info:
+        loader.load_from_yaml_string("""
+tasks:
+  - name: "Numeric"
+    interval: 300
+    prompt: "Check"
+  - name: "No prompt"
+    interval: 5m
+""")
+
+    message = str(exc_info.value)
+    assert "Invalid interval 300" in message
+    assert "in task 'Numeric'" in message
@@ -480,3 +480,17 @@ async def test_substitute_event_vars_with_source_type(mock_agent, state_manager)
 
     called_prompt = mock_agent.query.call_args[0][0]
     assert "Source: dbus" in called_prompt
+
+
+@pytest.mark.asyncio
+async def test_run_without_conditions_skips_metadata_extraction(mock_agent, state_manager, sample_task):
+    """Test that tasks without conditions don't scan the output for metadata"""
+    mock_agent.query.return_value = "Found 5 failures in the last hour"
+
+    with patch("ai_assist.task_runner.ConditionEvaluator") as mock_evaluator:
+        runner = TaskRunner(sample_task, mock_agent, state_manager)
+        result = await runner.run()
+
+    mock_evaluator.assert_not_called()
+    assert result.success is True
+    assert result.metadata == {}
@@ -328,3 +328,13 @@ def test_validate_interval_with_range():
         interval="30m between 8:00 and 18:00 on weekdays",
     )
     task2.validate()  # Should not raise
+
+
+def test_parse_time_schedule_results_are_independent():
+    """Test that memoized schedules don't leak mutations between callers"""
+    first = TaskLoader.parse_time_schedule("morning on weekdays")
+    first["days"].append(6)
+
+    second = TaskLoader.parse_time_schedule("morning on weekdays")
+
+    assert second["days"] == [0, 1, 2, 3, 4]
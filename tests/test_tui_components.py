@@ -5,7 +5,8 @@ from unittest.mock import MagicMock
 import pytest
 from prompt_toolkit.document import Document
 
-from ai_assist.tui import AiAssistCompleter, format_tool_args, format_tool_display_name
+from ai_assist.agent import AiAssistAgent
+from ai_assist.tui import AiAssistCompleter, _last_word, format_tool_args, format_tool_display_name
 
 
 def test_ai_assist_completer_initialization():
@@ -133,19 +134,24 @@ def test_completion_clear_cache_command():
     assert "/clear-cache" in completion_texts
 
 
+def _make_prompt(name, description):
+    prompt = MagicMock()
+    prompt.name = name
+    prompt.description = description
+    return prompt
+
+
 def _make_agent_with_prompts():
-    """Helper to create a mock agent with available_prompts."""
+    """Helper to create a mock agent with available_prompts and its completion snapshot."""
     agent = MagicMock()
-    rca_prompt = MagicMock()
-    rca_prompt.description = "Root cause analysis"
-    report_prompt = MagicMock()
-    report_prompt.description = "Generate a report"
+    type(agent).prompts_snapshot = AiAssistAgent.prompts_snapshot
     agent.available_prompts = {
         "dci": {
-            "rca": rca_prompt,
-            "report": report_prompt,
+            "rca": _make_prompt("rca", "Root cause analysis"),
+            "report": _make_prompt("report", "Generate a report"),
         }
     }
+    AiAssistAgent._refresh_prompts_snapshot(agent)
     return agent
 
 
@@ -359,3 +365,77 @@ def test_path_completion_not_triggered_for_regular_words():
     doc = Document("hello world", cursor_position=11)
     completions = list(completer.get_completions(doc, None))
     assert len(completions) == 0
+
+
+def test_prompt_completion_picks_up_refreshed_prompts():
+    """Test that prompt completion reflects prompts replaced after a server reconnect"""
+    agent = _make_agent_with_prompts()
+    completer = AiAssistCompleter(agent=agent)
+
+    document = Document("/dci/r", cursor_position=6)
+    assert len(list(completer.get_completions(document, None))) == 2
+
+    agent.available_prompts["dci"] = {"review": _make_prompt("review", "Review")}
+    AiAssistAgent._refresh_prompts_snapshot(agent)
+    texts = [c.text for c in completer.get_completions(document, None)]
+
+    assert texts == ["/dci/review"]
+
+
+def test_prompt_completion_is_case_insensitive():
+    """Test that prompt completion matches names regardless of case and keeps the original spelling"""
+    agent = _make_agent_with_prompts()
+    agent.available_prompts["dci"]["RunJob"] = _make_prompt("RunJob", "Run a job")
+    AiAssistAgent._refresh_prompts_snapshot(agent)
+    completer = AiAssistCompleter(agent=agent)
+
+    document = Document("/dci/RUN", cursor_position=8)
+    texts = [c.text for c in completer.get_completions(document, None)]
+
+    assert texts == ["/dci/RunJob"]
+
+
+def test_command_completion_keeps_declared_order():
+    """Test that matching commands are suggested in their declared order"""
+    completer = AiAssistCompleter()
+
+    document = Document("/", cursor_position=1)
+    texts = [c.text for c in completer.get_completions(document, None)]
+
+    assert texts == completer.commands
+
+
+def test_completions_are_capped():
+    """Test that large prompt catalogs yield at most MAX_COMPLETIONS candidates"""
+    agent = _make_agent_with_prompts()
+    agent.available_prompts["dci"] = {f"p{i:03d}": _make_prompt(f"p{i:03d}", None) for i in range(200)}
+    AiAssistAgent._refresh_prompts_snapshot(agent)
+    completer = AiAssistCompleter(agent=agent)
+
+    document = Document("/dci/p", cursor_position=6)
+    texts = [c.text for c in completer.get_completions(document, None)]
+
+    assert len(texts) == AiAssistCompleter.MAX_COMPLETIONS
+    assert texts[0] == "/dci/p000"
+
+
+@pytest.mark.parametrize("text", ["", "   ", "word", "two words", "trailing space ", "tab\tsep", "multi\nline /dci/r"])
+def test_last_word_matches_split(text):
+    """Test that _last_word agrees with text.split()[-1]"""
+    words = text.split()
+    assert _last_word(text) == (words[-1] if words else "")
+
+
+def test_completer_reads_published_snapshot_only():
+    """Test that in-place edits of available_prompts are not seen until a new snapshot is published"""
+    agent = _make_agent_with_prompts()
+    completer = AiAssistCompleter(agent=agent)
+
+    agent.available_prompts["dci"]["rerun"] = _make_prompt("rerun", "Rerun a job")
+    document = Document("/dci/re", cursor_position=7)
+
+    assert [c.text for c in completer.get_completions(document, None)] == ["/dci/report"]
+
+    AiAssistAgent._refresh_prompts_snapshot(agent)
+
+    assert [c.text for c in completer.get_completions(document, None)] == ["/dci/report", "/dci/rerun"]
@@ -1,5 +1,6 @@
 """Tests for TUI interactive mode"""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -8,9 +9,15 @@ from ai_assist.agent import AiAssistAgent
 from ai_assist.output import PlainRenderer
 from ai_assist.state import StateManager
 from ai_assist.tui_interactive import (
+    ConversationSaver,
+    _arg_prompt_session,
+    _get_terminal_attrs,
+    build_welcome_panel,
     handle_clear_cache_command,
     handle_help_command,
     handle_history_command,
+    handle_prompt_command,
+    handle_prompts_command,
     handle_status_command,
     tui_interactive_mode,
 )
@@ -146,6 +153,47 @@ async def test_help_command():
     assert "/history" in output_text
 
 
+@pytest.mark.asyncio
+async def test_prompts_table_is_rebuilt_only_when_prompts_change():
+    """Test /prompts reuses its table until the agent publishes a new prompts snapshot"""
+    from rich.table import Table
+
+    agent = MagicMock()
+    agent.available_prompts = {
+        "dci": {
+            "rca": SimpleNamespace(
+                description="Root cause", arguments=[SimpleNamespace(name="job", required=True, description=None)]
+            )
+        }
+    }
+    AiAssistAgent._refresh_prompts_snapshot(agent)
+    console = MagicMock()
+
+    await handle_prompts_command(agent, console)
+    await handle_prompts_command(agent, console)
+    tables = [c.args[0] for c in console.print.call_args_list if isinstance(c.args[0], Table)]
+    assert len(tables) == 2
+    assert tables[0] is tables[1]
+    assert tables[0].row_count == 1
+
+    agent.available_prompts["dci"]["weekly"] = SimpleNamespace(description=None, arguments=None)
+    AiAssistAgent._refresh_prompts_snapshot(agent)  # a rediscovery publishes a new snapshot
+    console.print.reset_mock()
+    await handle_prompts_command(agent, console)
+    (table,) = [c.args[0] for c in console.print.call_args_list if isinstance(c.args[0], Table)]
+    assert table is not tables[0]
+    assert table.row_count == 2
+
+
+def test_welcome_panel_is_built_once_per_greeting_and_skills():
+    """Test the welcome banner reflects the skills count and is reused for the same inputs"""
+    panel = build_welcome_panel("Hello", 3)
+
+    assert build_welcome_panel("Hello", 3) is panel
+    assert "3 Agent Skills loaded" in panel.renderable
+    assert "/skill/install" in build_welcome_panel("Hello", 0).renderable
+
+
 @pytest.mark.asyncio
 async def test_tui_mode_initializes(mock_agent, mock_state_manager):
     """Test TUI mode initializes without errors"""
@@ -163,6 +211,23 @@ async def test_tui_mode_initializes(mock_agent, mock_state_manager):
         mock_state_manager.save_conversation_context.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_tui_mode_saves_only_restorable_exchanges(mock_agent, mock_state_manager):
+    """Test that the persisted session context is capped at what conversation memory restores"""
+    previous = [{"user": f"q{i}", "assistant": f"a{i}", "timestamp": str(i)} for i in range(15)]
+    mock_state_manager.load_conversation_context = MagicMock(return_value={"messages": previous})
+
+    with patch("ai_assist.tui_interactive.PromptSession") as mock_session_class:
+        mock_session = AsyncMock()
+        mock_session.prompt_async = AsyncMock(side_effect=["/exit"])
+        mock_session_class.return_value = mock_session
+
+        await tui_interactive_mode(mock_agent, mock_state_manager)
+
+    (_, context), _ = mock_state_manager.save_conversation_context.call_args
+    assert context["messages"] == previous[-10:]
+
+
 @pytest.mark.asyncio
 async def test_multiline_input_handling(mock_state_manager):
     """Test multi-line input is parsed correctly"""
@@ -472,3 +537,187 @@ async def test_query_with_feedback_cancellation():
     assert result == "Partial response"
     output_text = output.getvalue()
     assert "cancelled" in output_text.lower()
+
+
+def test_get_terminal_attrs_without_tty():
+    """Test that saving terminal attributes is a no-op when stdin is not a terminal"""
+    from io import StringIO
+
+    with patch("sys.stdin", StringIO()):
+        assert _get_terminal_attrs() is None
+
+
+@pytest.mark.asyncio
+async def test_handle_prompt_command_ignores_other_slash_commands():
+    """Test that only /server/prompt shaped input is treated as a prompt command"""
+    from io import StringIO
+
+    from rich.console import Console
+
+    console = Console(file=StringIO())
+    agent = MagicMock()
+    agent.sessions = {}
+
+    for command in ("/status", "/a/b/c", "/a//b", "/"):
+        assert await handle_prompt_command(command, agent, [], console, MagicMock()) is False
+
+    # /server/prompt with an unknown server is still handled (with an error message)
+    assert await handle_prompt_command("/dci/report/", agent, [], console, MagicMock()) is True
+    assert "Unknown MCP server: dci" in console.file.getvalue()
+
+
+def test_arg_prompt_session_is_reused():
+    """Test that prompt argument collection reuses one prompt_toolkit session"""
+    _arg_prompt_session.cache_clear()
+    try:
+        with patch("ai_assist.tui_interactive.PromptSession") as mock_session_class:
+            assert _arg_prompt_session() is _arg_prompt_session()
+        mock_session_class.assert_called_once_with()
+    finally:
+        _arg_prompt_session.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_handle_prompt_command_previews_start_of_prompt_verbatim():
+    """Test that the loaded-prompt panel shows only the start of the first message, without markup"""
+    from io import StringIO
+
+    from rich.console import Console
+
+    console = Console(file=StringIO(), width=300)
+    text = "[/bold] check " + "x" * 1000
+    session = MagicMock()
+    session.get_prompt = AsyncMock(
+        return_value=SimpleNamespace(messages=[SimpleNamespace(role="user", content=SimpleNamespace(text=text))])
+    )
+    agent = MagicMock()
+    agent.sessions = {"dci": session}
+    agent.available_prompts = {"dci": {"report": SimpleNamespace(arguments=None)}}
+    history: list = []
+
+    assert await handle_prompt_command("/dci/report", agent, history, console, MagicMock()) is True
+
+    output = console.file.getvalue()
+    assert "Prompt Loaded" in output
+    assert "[/bold] check" in output
+    assert "x" * 201 not in output
+    assert history == [{"role": "user", "content": text}]
+
+
+@pytest.mark.asyncio
+async def test_conversation_saver_writes_queued_exchanges_in_one_batch():
+    """Test that exchanges queued together are saved in a single KG batch, and stop() flushes them"""
+    kg = MagicMock()
+    saver = ConversationSaver(kg)
+
+    saver.save("q1", "a1")
+    saver.save("q2", "a2")
+    saver.start()
+    await saver.stop()
+
+    kg.batch.assert_called_once()
+    assert [call.kwargs["data"] for call in kg.insert_entity.call_args_list] == [
+        {"user": "q1", "assistant": "a1"},
+        {"user": "q2", "assistant": "a2"},
+    ]
+    assert all(call.kwargs["entity_type"] == "conversation" for call in kg.insert_entity.call_args_list)
+
+
+@pytest.mark.asyncio
+async def test_conversation_saver_skips_small_talk_and_repeats():
+    """Test that greetings and exchanges repeated within the session are not saved again"""
+    kg = MagicMock()
+    saver = ConversationSaver(kg)
+
+    saver.save("Thanks!", "You're welcome.")
+    saver.save("hello", "Hi, how can I help?")
+    saver.save("status of job 42?", "Job 42 failed.")
+    saver.save("status of job 42? ", "Job 42 failed.")
+    saver.save("status of job 42?", "Job 42 passed after a retry.")
+    saver.save("ok", "Restarting job 42.")
+    saver.start()
+    await saver.stop()
+
+    assert [call.kwargs["data"]["assistant"] for call in kg.insert_entity.call_args_list] == [
+        "Job 42 failed.",
+        "Job 42 passed after a retry.",
+        "Restarting job 42.",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_conversation_saver_stop_cancelled_still_stops_writer():
+    """Test that cancelling stop() while it waits for pending writes does not orphan the writer task"""
+    import asyncio
+    import time
+
+    kg = MagicMock()
+    kg.insert_entity.side_effect = lambda **_: time.sleep(0.2)
+    saver = ConversationSaver(kg)
+    saver.save("what failed in job 42?", "The install step.")
+    saver.start()
+    worker = saver._worker
+
+    stop = asyncio.create_task(saver.stop())
+    await asyncio.sleep(0.05)
+    stop.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await stop
+
+    assert worker.done()
+    assert saver._worker is None
+
+
+@pytest.mark.asyncio
+async def test_tui_mode_shutdown_survives_failing_watcher_stop(mock_agent, mock_state_manager):
+    """Test that a watcher failing to stop does not break shutdown or skip the other cleanup"""
+    with (
+        patch("ai_assist.tui_interactive.PromptSession") as mock_session_class,
+        patch("ai_assist.tui_interactive.ConfigWatcher.stop", AsyncMock(side_effect=RuntimeError("boom"))),
+        patch("ai_assist.tui_interactive.NotificationWatcher.stop", AsyncMock()) as notification_stop,
+        patch("ai_assist.tui_interactive.reset_terminal_title") as reset_title,
+    ):
+        mock_session = AsyncMock()
+        mock_session.prompt_async = AsyncMock(side_effect=["/exit"])
+        mock_session_class.return_value = mock_session
+
+        await tui_interactive_mode(mock_agent, mock_state_manager)
+
+    notification_stop.assert_awaited_once()
+    reset_title.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_conversation_saver_retries_exchange_after_failed_write():
+    """Test that an exchange whose write failed is not dropped as a repeat when saved again"""
+    kg = MagicMock()
+    kg.insert_entity.side_effect = [RuntimeError("database is locked"), None]
+    saver = ConversationSaver(kg)
+    saver.start()
+
+    saver.save("what failed in job 42?", "The install step.")
+    await saver._queue.join()
+    saver.save("what failed in job 42?", "The install step.")
+    await saver.stop()
+
+    assert kg.insert_entity.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_tui_mode_cleans_up_after_failing_watcher_start(mock_agent, mock_state_manager):
+    """Test that a watcher failing to start still lets the session run and shut down cleanly"""
+    with (
+        patch("ai_assist.tui_interactive.PromptSession") as mock_session_class,
+        patch("ai_assist.tui_interactive.ConfigWatcher.start", AsyncMock(side_effect=OSError("inotify limit"))),
+        patch("ai_assist.tui_interactive.NotificationWatcher.start", AsyncMock()),
+        patch("ai_assist.tui_interactive.NotificationWatcher.stop", AsyncMock()) as notification_stop,
+        patch("ai_assist.tui_interactive.reset_terminal_title") as reset_title,
+    ):
+        mock_session = AsyncMock()
+        mock_session.prompt_async = AsyncMock(side_effect=["/exit"])
+        mock_session_class.return_value = mock_session
+
+        await tui_interactive_mode(mock_agent, mock_state_manager)
+
+    notification_stop.assert_awaited_once()
+    reset_title.assert_called_once()
@@ -1,5 +1,6 @@
 """Tests for TUI notification display"""
 
+import asyncio
 import json
 from datetime import datetime
 from unittest.mock import MagicMock
@@ -144,3 +145,117 @@ async def test_notification_watcher_start_stop(tmp_path):
 
     await watcher.stop()
     # Verify it stopped cleanly (no exceptions)
+
+
+@pytest.mark.asyncio
+async def test_notification_watcher_waits_for_complete_lines(tmp_path):
+    """Test that a partially written entry is only displayed once its line is complete"""
+    console = MagicMock()
+    notification_log = tmp_path / "notifications.log"
+    notification_log.write_text("")
+
+    watcher = NotificationWatcher(console)
+    watcher.notification_log = notification_log
+    await watcher.initialize()
+
+    line = json.dumps({"timestamp": "now", "level": "info", "title": "Partial", "message": "Split write"})
+    with open(notification_log, "a") as f:
+        f.write(line[:10])
+    await watcher.on_file_change()
+
+    assert watcher.last_position == 0
+    assert watcher._queue.empty()
+
+    with open(notification_log, "a") as f:
+        f.write(line[10:] + "\n")
+    await watcher.on_file_change()
+
+    assert watcher.last_position == len(line) + 1
+    assert watcher._queue.get_nowait()["title"] == "Partial"
+
+
+@pytest.mark.asyncio
+async def test_notification_watcher_prints_burst_once(tmp_path):
+    """Test that several new notifications are rendered with a single print"""
+    console = MagicMock()
+    notification_log = tmp_path / "notifications.log"
+    notification_log.write_text("")
+
+    watcher = NotificationWatcher(console)
+    watcher.notification_log = notification_log
+    await watcher.initialize()
+
+    with open(notification_log, "a") as f:
+        for i in range(3):
+            f.write(json.dumps({"timestamp": "now", "level": "info", "title": f"N{i}", "message": "Burst"}) + "\n")
+    await watcher.on_file_change()
+    assert watcher._queue.qsize() == 3
+
+    printer = asyncio.create_task(watcher._print_notifications())
+    await asyncio.sleep(0.05)
+    printer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await printer
+
+    console.print.assert_called_once()
+    (group,) = console.print.call_args.args
+    assert len(group.renderables) == 9
+
+
+@pytest.mark.asyncio
+async def test_notification_watcher_drops_oldest_when_queue_full(tmp_path):
+    """Test that a full queue drops the oldest notifications instead of blocking the watcher"""
+    notification_log = tmp_path / "notifications.log"
+    notification_log.write_text("")
+
+    watcher = NotificationWatcher(MagicMock())
+    watcher.notification_log = notification_log
+    watcher._queue = asyncio.Queue(maxsize=2)
+
+    with open(notification_log, "a") as f:
+        for i in range(3):
+            f.write(json.dumps({"timestamp": "now", "level": "info", "title": f"N{i}", "message": "Burst"}) + "\n")
+    await watcher.on_file_change()
+
+    assert [watcher._queue.get_nowait()["title"] for _ in range(2)] == ["N1", "N2"]
+
+
+def test_read_new_lines_stops_at_last_complete_line(tmp_path):
+    """Test that the tail read returns complete lines only and skips reads when nothing was appended"""
+    notification_log = tmp_path / "notifications.log"
+    notification_log.write_bytes(b'{"a": 1}\n{"b": 2}\n{"c"')
+
+    watcher = NotificationWatcher(MagicMock())
+    watcher.notification_log = notification_log
+
+    lines, position = watcher._read_new_lines(0)
+    assert lines == [b'{"a": 1}', b'{"b": 2}']
+    assert position == 18
+
+    assert watcher._read_new_lines(notification_log.stat().st_size) == ([], notification_log.stat().st_size)
+
+
+@pytest.mark.asyncio
+async def test_notification_watcher_follows_rotated_and_truncated_log(tmp_path):
+    """Test that the kept-open log handle is reopened on rotation and rewound on truncation"""
+    notification_log = tmp_path / "notifications.log"
+    notification_log.write_bytes(b'{"a": 1}\n')
+
+    watcher = NotificationWatcher(MagicMock())
+    watcher.notification_log = notification_log
+
+    assert watcher._read_new_lines(0) == ([b'{"a": 1}'], 9)
+    log_file = watcher._log_file
+
+    # Rotation: the path now points to a new file
+    notification_log.rename(tmp_path / "notifications.log.1")
+    notification_log.write_bytes(b'{"b": 2}\n')
+    assert watcher._read_new_lines(9) == ([b'{"b": 2}'], 9)
+    assert log_file.closed
+
+    # Truncation in place
+    notification_log.write_bytes(b"{}\n")
+    assert watcher._read_new_lines(9) == ([b"{}"], 3)
+
+    await watcher.stop()
+    assert watcher._log_file is None